@@ -6,26 +6,53 @@ Creates key visualizations for academic report and presentation.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless backend, also for worker processes
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
+import argparse
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+import subprocess
 from pathlib import Path
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# Default output directory (created by main)
+OUTPUT_DIR = Path("outputs/figures")
 
-print("=" * 70)
-print("📊 VENTURE-SCOPE: Visualization Generator")
-print("=" * 70)
 
-# Create output directory
-output_dir = Path("outputs/figures")
-output_dir.mkdir(parents=True, exist_ok=True)
+def setup_style():
+    """Apply the plot style; runs in each worker process."""
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+
+
+def save_fig(fig, path, hq=False, fmt='png'):
+    """
+    Save a figure.
+
+    PNG drafts are rendered at 150 DPI with fast zlib compression;
+    hq=True renders publication copies at 300 DPI with default compression.
+    fmt='svg' writes a vector file instead, skipping rasterization entirely.
+    """
+    path = Path(path)
+    if fmt == 'svg':
+        path = path.with_suffix('.svg')
+        fig.savefig(path, bbox_inches='tight')
+    else:
+        fig.savefig(
+            path,
+            dpi=300 if hq else 150,
+            bbox_inches='tight',
+            pil_kwargs={'compress_level': 6 if hq else 1, 'optimize': False}
+        )
+    print(f"   ✅ Saved: {path}")
+    return path
 
 
 # ==================== 1. MODEL COMPARISON ====================
 
-def create_model_comparison():
+def create_model_comparison(output_dir, hq=False, fmt='png'):
     """Bar chart comparing 4 ML models."""
     
     print("\n📊 Creating Model Comparison Chart...")
@@ -39,7 +66,8 @@ def create_model_comparison():
         'F1-Score': [82.2, 81.5, 74.7, 71.4]
     }
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = Figure(figsize=(12, 7), constrained_layout=True)
+    ax = fig.subplots()
     
     x = np.arange(len(models))
     width = 0.2
@@ -51,11 +79,7 @@ def create_model_comparison():
         bars = ax.bar(x + offset, values, width, label=metric, color=colors[i], alpha=0.8)
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.1f}%',
-                   ha='center', va='bottom', fontsize=9, fontweight='bold')
+        ax.bar_label(bars, fmt='%.1f%%', padding=2, fontsize=9, fontweight='bold')
     
     ax.set_xlabel('Model', fontsize=12, fontweight='bold')
     ax.set_ylabel('Score (%)', fontsize=12, fontweight='bold')
@@ -72,17 +96,13 @@ def create_model_comparison():
             fontweight='bold', color='#2ecc71',
             bbox=dict(boxstyle='round', facecolor='white', edgecolor='#2ecc71', linewidth=2))
     
-    plt.tight_layout()
-    
     output_path = output_dir / "model_comparison.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"   ✅ Saved: {output_path}")
-    plt.close()
+    return save_fig(fig, output_path, hq=hq, fmt=fmt)
 
 
 # ==================== 2. CONFUSION MATRIX ====================
 
-def create_confusion_matrix():
+def create_confusion_matrix(output_dir, hq=False, fmt='png'):
     """Heatmap of confusion matrix for Random Forest."""
     
     print("\n📊 Creating Confusion Matrix...")
@@ -93,10 +113,11 @@ def create_confusion_matrix():
         [57, 506]    # Actual Success
     ])
     
-    fig, ax = plt.subplots(figsize=(8, 7))
+    fig = Figure(figsize=(8, 7), constrained_layout=True)
+    ax = fig.subplots()
     
     # Create heatmap
-    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', 
+    sns.heatmap(cm, ax=ax, annot=True, fmt='d', cmap='Blues', 
                 cbar_kws={'label': 'Count'},
                 linewidths=2, linecolor='white',
                 annot_kws={'size': 16, 'weight': 'bold'})
@@ -118,17 +139,14 @@ def create_confusion_matrix():
             fontsize=11, verticalalignment='center',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    plt.tight_layout()
-    
     output_path = output_dir / "confusion_matrix.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"   ✅ Saved: {output_path}")
-    plt.close()
+    # Heatmap stays raster PNG regardless of fmt
+    return save_fig(fig, output_path, hq=hq)
 
 
 # ==================== 3. FEATURE IMPORTANCE ====================
 
-def create_feature_importance():
+def create_feature_importance(output_dir, hq=False, fmt='png'):
     """Bar chart of top 10 feature importances."""
     
     print("\n📊 Creating Feature Importance Chart...")
@@ -142,17 +160,14 @@ def create_feature_importance():
     importances = [25.9, 11.7, 10.9, 10.2, 7.7, 7.6, 6.3, 5.0, 4.1, 1.6]
     
     # Create horizontal bar chart
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig = Figure(figsize=(10, 7), constrained_layout=True)
+    ax = fig.subplots()
     
     colors = plt.cm.viridis(np.linspace(0.3, 0.9, len(features)))
     bars = ax.barh(features, importances, color=colors, alpha=0.8)
     
     # Add value labels
-    for i, (bar, importance) in enumerate(zip(bars, importances)):
-        width = bar.get_width()
-        ax.text(width + 0.5, bar.get_y() + bar.get_height()/2,
-               f'{importance:.1f}%',
-               ha='left', va='center', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, fmt='%.1f%%', padding=3, fontsize=10, fontweight='bold')
     
     ax.set_xlabel('Importance (%)', fontsize=12, fontweight='bold')
     ax.set_ylabel('Feature', fontsize=12, fontweight='bold')
@@ -164,23 +179,20 @@ def create_feature_importance():
     # Invert y-axis so most important is on top
     ax.invert_yaxis()
     
-    plt.tight_layout()
-    
     output_path = output_dir / "feature_importance.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"   ✅ Saved: {output_path}")
-    plt.close()
+    return save_fig(fig, output_path, hq=hq, fmt=fmt)
 
 
 # ==================== 4. MISSING DATA ANALYSIS ====================
 
-def create_missing_data_comparison():
+def create_missing_data_comparison(output_dir, hq=False, fmt='png'):
     """Box plot comparing funding for missing vs present investor data."""
     
     print("\n📊 Creating Missing Data Analysis Chart...")
     
     # Create figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig = Figure(figsize=(14, 6), constrained_layout=True)
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Subplot 1: Bar chart - Mean and Median comparison
     categories = ['Missing\nInvestors', 'With\nInvestors']
@@ -197,11 +209,7 @@ def create_missing_data_comparison():
     
     # Add value labels
     for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'${height:.2f}M',
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
+        ax1.bar_label(bars, fmt='$%.2fM', padding=2, fontsize=10, fontweight='bold')
     
     ax1.set_ylabel('Funding Amount (Millions USD)', fontsize=11, fontweight='bold')
     ax1.set_title('Funding Comparison by Data Completeness', 
@@ -224,11 +232,7 @@ def create_missing_data_comparison():
     bars = ax2.barh(stages, missing_rates, color='#e67e22', alpha=0.8)
     
     # Add value labels
-    for bar, rate in zip(bars, missing_rates):
-        width = bar.get_width()
-        ax2.text(width + 1, bar.get_y() + bar.get_height()/2,
-                f'{rate:.1f}%',
-                ha='left', va='center', fontsize=10, fontweight='bold')
+    ax2.bar_label(bars, fmt='%.1f%%', padding=3, fontsize=10, fontweight='bold')
     
     ax2.set_xlabel('Missing Rate (%)', fontsize=11, fontweight='bold')
     ax2.set_ylabel('Funding Stage', fontsize=11, fontweight='bold')
@@ -242,22 +246,19 @@ def create_missing_data_comparison():
     ax2.text(32, 2, 'High Risk\nThreshold', color='red', 
              fontsize=9, fontweight='bold')
     
-    plt.tight_layout()
-    
     output_path = output_dir / "missing_data_analysis.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"   ✅ Saved: {output_path}")
-    plt.close()
+    return save_fig(fig, output_path, hq=hq, fmt=fmt)
 
 
 # ==================== 5. BONUS: ROC CURVES ====================
 
-def create_roc_curves():
+def create_roc_curves(output_dir, hq=False, fmt='png'):
     """ROC curves for model comparison."""
     
     print("\n📊 Creating ROC Curves...")
     
-    fig, ax = plt.subplots(figsize=(9, 8))
+    fig = Figure(figsize=(9, 8), constrained_layout=True)
+    ax = fig.subplots()
     
     # Simplified ROC curve data (approximated from AUC scores)
     models_roc = {
@@ -267,13 +268,13 @@ def create_roc_curves():
         'SVM (AUC=0.757)': {'color': '#95a5a6', 'auc': 0.757, 'style': ':'}
     }
     
-    # Generate approximate ROC curves
-    for model, props in models_roc.items():
-        # Simplified curve generation based on AUC
-        fpr = np.linspace(0, 1, 100)
-        tpr = fpr ** (1 / props['auc'])  # Approximate
-        tpr = tpr / tpr[-1]  # Normalize
-        
+    # Generate approximate ROC curves (one broadcast for all models)
+    fpr = np.linspace(0, 1, 100)
+    aucs = np.array([props['auc'] for props in models_roc.values()])
+    tprs = fpr[None, :] ** (1 / aucs[:, None])  # Approximate
+    tprs /= tprs[:, -1:]  # Normalize
+    
+    for (model, props), tpr in zip(models_roc.items(), tprs):
         ax.plot(fpr, tpr, label=model, color=props['color'], 
                 linewidth=2.5, linestyle=props['style'], alpha=0.8)
     
@@ -294,12 +295,31 @@ def create_roc_curves():
             fontsize=11, style='italic',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    plt.tight_layout()
-    
     output_path = output_dir / "roc_curves.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"   ✅ Saved: {output_path}")
-    plt.close()
+    return save_fig(fig, output_path, hq=hq, fmt=fmt)
+
+
+# ==================== PNG OPTIMIZATION ====================
+
+def optimize_pngs(directory):
+    """
+    Losslessly recompress PNGs in directory with oxipng (or optipng).
+    
+    Shrinks files for the report/presentation; skipped if neither tool
+    is installed.
+    """
+    if shutil.which("oxipng"):
+        base_cmd = ["oxipng", "-o", "4", "--strip", "safe"]
+    elif shutil.which("optipng"):
+        base_cmd = ["optipng", "-o2", "-quiet"]
+    else:
+        print("\n⚠️  Neither oxipng nor optipng found, skipping PNG optimization")
+        return
+    
+    print(f"\n🗜️  Optimizing PNGs with {base_cmd[0]}...")
+    for png in sorted(Path(directory).glob("*.png")):
+        subprocess.run(base_cmd + [str(png)], check=True)
+        print(f"   ✅ Optimized: {png}")
 
 
 # ==================== MAIN ====================
@@ -307,25 +327,50 @@ def create_roc_curves():
 def main():
     """Generate all visualizations."""
     
+    parser = argparse.ArgumentParser(description="Generate VENTURE-SCOPE figures")
+    parser.add_argument('--hq', action='store_true',
+                        help="Render publication copies (300 DPI, full compression)")
+    parser.add_argument('--optimize', action='store_true',
+                        help="Losslessly shrink PNGs with oxipng/optipng afterwards")
+    parser.add_argument('--format', choices=['png', 'svg'], default='png',
+                        help="Output format for vector-friendly charts (default: png)")
+    args = parser.parse_args()
+    
+    print("=" * 70)
+    print("📊 VENTURE-SCOPE: Visualization Generator")
+    print("=" * 70)
+    
+    # Create output directory
+    output_dir = OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
     print("\n🎨 Generating visualizations...\n")
     
-    # Create all charts
-    create_model_comparison()
-    create_confusion_matrix()
-    create_feature_importance()
-    create_missing_data_comparison()
-    create_roc_curves()
+    # Create all charts (independent and CPU-bound, so one process each)
+    charts = [
+        create_model_comparison,
+        create_confusion_matrix,
+        create_feature_importance,
+        create_missing_data_comparison,
+        create_roc_curves,
+    ]
+    with ProcessPoolExecutor(max_workers=len(charts), initializer=setup_style) as executor:
+        futures = [
+            executor.submit(chart, output_dir, hq=args.hq, fmt=args.format)
+            for chart in charts
+        ]
+        paths = [future.result() for future in futures]
+    
+    if args.optimize:
+        optimize_pngs(output_dir)
     
     print("\n" + "=" * 70)
     print("✅ All visualizations created successfully!")
     print("=" * 70)
     print(f"\n📁 Location: {output_dir}/")
     print("\nGenerated files:")
-    print("  1. model_comparison.png")
-    print("  2. confusion_matrix.png")
-    print("  3. feature_importance.png")
-    print("  4. missing_data_analysis.png")
-    print("  5. roc_curves.png")
+    for i, path in enumerate(paths, 1):
+        print(f"  {i}. {path.name}")
     print("=" * 70)
 
 
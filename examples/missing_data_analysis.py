@@ -26,7 +26,17 @@ def load_data():
         print(f"❌ Data not found: {data_path}")
         return None
     
-    df = pd.read_csv(data_path)
+    df = pd.read_csv(
+        data_path,
+        usecols=['company', 'stage', 'country', 'sector', 'status',
+                 'funding_amount', 'investors_count'],
+        dtype={'stage': 'category', 'country': 'category', 'sector': 'category'}
+    )
+    
+    # Downcast numeric columns (pandas only downcasts when values fit)
+    df['funding_amount'] = pd.to_numeric(df['funding_amount'], downcast='float')
+    df['investors_count'] = pd.to_numeric(df['investors_count'], downcast='integer')
+    
     print(f"✅ Loaded {len(df):,} companies")
     return df
 
@@ -83,22 +93,35 @@ def analyze_investors_missing(df):
     }
 
 
+def _missing_stats_by(df, col):
+    """
+    Per-group investor reporting stats (0 investors counts as missing).
+    
+    Uses named built-in aggregations on a precomputed 0/1 flag so the
+    groupby stays on the Cython path.
+    """
+    grouped = df.assign(
+        _inv_missing=df['investors_count'].eq(0).astype('int8')
+    ).groupby(col, observed=True)
+    
+    stats_df = grouped.agg(
+        Total=('investors_count', 'count'),
+        Missing=('_inv_missing', 'sum'),
+        Rows=('_inv_missing', 'size'),
+        **{'Avg Funding': ('funding_amount', 'mean')}
+    )
+    stats_df['Missing %'] = stats_df['Missing'] / stats_df['Rows'] * 100
+    return stats_df.drop(columns='Rows').round(2)
+
+
 def analyze_by_stage(df):
     """Analyze missing data by funding stage."""
     print("\n" + "=" * 70)
     print("📊 MISSING DATA BY STAGE")
     print("=" * 70)
     
-    stage_analysis = df.groupby('stage').agg({
-        'investors_count': [
-            ('total', 'count'),
-            ('missing', lambda x: (x == 0).sum()),
-            ('missing_rate', lambda x: (x == 0).sum() / len(x) * 100),
-            ('mean_funding', lambda x: df.loc[x.index, 'funding_amount'].mean())
-        ]
-    }).round(2)
-    
-    stage_analysis.columns = ['Total', 'Missing', 'Missing %', 'Avg Funding']
+    stage_analysis = _missing_stats_by(df, 'stage')
+    stage_analysis = stage_analysis[['Total', 'Missing', 'Missing %', 'Avg Funding']]
     stage_analysis = stage_analysis.sort_values('Missing %', ascending=False)
     
     print("\n", stage_analysis.to_string())
@@ -115,15 +138,8 @@ def analyze_by_sector(df):
     print("📊 MISSING DATA BY SECTOR (Top 10)")
     print("=" * 70)
     
-    sector_analysis = df.groupby('sector').agg({
-        'investors_count': [
-            ('total', 'count'),
-            ('missing_rate', lambda x: (x == 0).sum() / len(x) * 100),
-            ('mean_funding', lambda x: df.loc[x.index, 'funding_amount'].mean())
-        ]
-    }).round(2)
-    
-    sector_analysis.columns = ['Total', 'Missing %', 'Avg Funding']
+    sector_analysis = _missing_stats_by(df, 'sector')
+    sector_analysis = sector_analysis[['Total', 'Missing %', 'Avg Funding']]
     
     # Filter sectors with at least 100 companies
     sector_analysis = sector_analysis[sector_analysis['Total'] >= 100]
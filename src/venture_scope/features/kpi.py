@@ -29,6 +29,16 @@ STAGE_WEIGHTS = {
 
 # ==================== KPI FUNCTIONS ====================
 
+def _stage_lookup(stages: pd.Series, values: dict, default: float) -> pd.Series:
+    """
+    Map each stage to a per-stage value (default for unknown/missing stages).
+    
+    The result is cast to float before filling, so categorical stage
+    columns (as returned by the loaders) work like string ones.
+    """
+    return stages.map(values).astype('float64').fillna(default)
+
+
 def estimate_revenue(
     df: pd.DataFrame,
     method: str = 'funding_based'
@@ -52,7 +62,7 @@ def estimate_revenue(
         'Series D+': 1.00,
     }
     
-    stage_multiple = df['stage'].map(revenue_multiples).fillna(0.20)
+    stage_multiple = _stage_lookup(df['stage'], revenue_multiples, 0.20)
     estimated_revenue = df['funding_amount'] * stage_multiple
     
     return estimated_revenue
@@ -98,7 +108,7 @@ def estimate_burn_rate(
     company_age = current_year - df[founded_col].fillna(current_year)
     company_age = company_age.clip(lower=1)
     
-    burn_period_months = df['stage'].map({
+    burn_period_months = _stage_lookup(df['stage'], {
         'Pre-Seed': 12,
         'Seed': 18,
         'Angel': 18,
@@ -106,7 +116,7 @@ def estimate_burn_rate(
         'Series B': 30,
         'Series C': 36,
         'Series D+': 36,
-    }).fillna(24)
+    }, 24)
     
     monthly_burn = df[funding_col] / burn_period_months
     
@@ -198,7 +208,7 @@ def calculate_traction_index(
     """
     funding_score = np.log10(df[funding_col].clip(lower=1))
     investors_score = df[investors_col].fillna(1).clip(lower=1)
-    stage_weight = df['stage'].map(STAGE_WEIGHTS).fillna(1.0)
+    stage_weight = _stage_lookup(df['stage'], STAGE_WEIGHTS, 1.0)
     
     current_year = 2013
     age = (current_year - df[age_col].fillna(current_year)).clip(lower=1)
@@ -249,7 +259,7 @@ def estimate_rule_of_40(
     }
     
     # Base estimate from stage
-    estimated_rule = df[stage_col].map(rule_of_40_benchmarks).fillna(60)
+    estimated_rule = _stage_lookup(df[stage_col], rule_of_40_benchmarks, 60)
     
     # Adjust based on capital efficiency (if available)
     if use_capital_efficiency and 'capital_efficiency' in df.columns:
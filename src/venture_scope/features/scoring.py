@@ -8,6 +8,11 @@ import pandas as pd
 import numpy as np
 from typing import Optional, Dict
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to the NumPy path
+    njit = None
+
 print("=== SCORING ENGINE LOADED ===")
 
 DEFAULT_WEIGHTS = {
@@ -18,6 +23,8 @@ DEFAULT_WEIGHTS = {
     'runway_months': 0.15,
 }
 
+KPI_COLUMNS = ('rule_of_40', 'traction_index', 'capital_efficiency', 'burn_multiple', 'runway_months')
+
 def normalize_to_100(series: pd.Series, min_val: float = None, max_val: float = None) -> pd.Series:
     """Normalize series to 0-100 scale."""
     if min_val is None:
@@ -29,37 +36,77 @@ def normalize_to_100(series: pd.Series, min_val: float = None, max_val: float =
     normalized = (series - min_val) / (max_val - min_val) * 100
     return normalized.clip(0, 100)
 
+def _kpi_matrix(df: pd.DataFrame) -> np.ndarray:
+    """
+    Stack the five KPI columns into an (n, 5) float32 matrix.
+    
+    Columns follow KPI_COLUMNS order; KPIs missing from df are left as NaN.
+    """
+    arr = np.full((len(df), len(KPI_COLUMNS)), np.nan, dtype=np.float32)
+    for j, col in enumerate(KPI_COLUMNS):
+        if col in df.columns:
+            arr[:, j] = df[col].to_numpy(dtype=np.float32, na_value=np.nan)
+    return arr
+
+def _normalize_kpi_matrix(arr: np.ndarray) -> np.ndarray:
+    """Normalize a KPI matrix from _kpi_matrix to 0-100, in place."""
+    # Rule of 40 / Traction Index: clip to 0-100
+    np.clip(arr[:, 0:2], 0, 100, out=arr[:, 0:2])
+    # Capital Efficiency: 0-1 -> 0-100
+    arr[:, 2] = np.clip(arr[:, 2], 0, 1.0) * 100
+    # Burn Multiple: LOWER is better, so invert, then scale 0.1-3.0 -> 0-100
+    inverted = 1 / np.clip(arr[:, 3], 0.1, None)
+    arr[:, 3] = np.clip((inverted - 0.1) / (3.0 - 0.1) * 100, 0, 100)
+    # Runway: more is better, 0-24 months -> 0-100
+    arr[:, 4] = np.clip(arr[:, 4], 0, 24) / 24 * 100
+    
+    return arr
+
+if njit is not None:
+    @njit(parallel=True)
+    def _score_kernel(arr, w, use):
+        """
+        Fused per-row version of _normalize_kpi_matrix + weighted sum.
+        
+        Normalizes arr in place (same float32 steps as the NumPy path) and
+        returns the float64 score; columns with use[j] == False are skipped.
+        """
+        f32 = np.float32
+        score = np.zeros(arr.shape[0], dtype=np.float64)
+        for i in prange(arr.shape[0]):
+            arr[i, 0] = min(max(arr[i, 0], f32(0)), f32(100))
+            arr[i, 1] = min(max(arr[i, 1], f32(0)), f32(100))
+            arr[i, 2] = min(max(arr[i, 2], f32(0)), f32(1.0)) * f32(100)
+            inverted = f32(1) / max(arr[i, 3], f32(0.1))
+            arr[i, 3] = min(max((inverted - f32(0.1)) / f32(3.0 - 0.1) * f32(100), f32(0)), f32(100))
+            arr[i, 4] = min(max(arr[i, 4], f32(0)), f32(24)) / f32(24) * f32(100)
+            
+            total = 0.0
+            for j in range(arr.shape[1]):
+                if use[j]:
+                    total += arr[i, j] * w[j]
+            score[i] = total
+        return score
+else:
+    _score_kernel = None
+
+def _attach_norm_columns(df: pd.DataFrame, arr: np.ndarray) -> pd.DataFrame:
+    """Return df with *_norm columns from a normalized KPI matrix."""
+    # Attach the *_norm columns as one sidecar frame instead of copying df
+    present = [j for j, col in enumerate(KPI_COLUMNS) if col in df.columns]
+    norm_df = pd.DataFrame(
+        arr[:, present],
+        columns=[f'{KPI_COLUMNS[j]}_norm' for j in present],
+        index=df.index
+    )
+    stale = [c for c in norm_df.columns if c in df.columns]
+    base = df.drop(columns=stale) if stale else df
+    return pd.concat([base, norm_df], axis=1)
+
 def normalize_kpis(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize all KPIs to 0-100 scale."""
     print("  Normalizing KPIs...")
-    result = df.copy()
-    
-    # Rule of 40: clip to 0-100
-    if 'rule_of_40' in df.columns:
-        result['rule_of_40_norm'] = df['rule_of_40'].clip(0, 100)
-    
-    # Traction Index: already 0-100
-    if 'traction_index' in df.columns:
-        result['traction_index_norm'] = df['traction_index'].clip(0, 100)
-    
-    # Capital Efficiency: 0-1 -> 0-100
-    if 'capital_efficiency' in df.columns:
-        capped = df['capital_efficiency'].clip(0, 1.0)
-        result['capital_efficiency_norm'] = capped * 100
-    
-    # Burn Multiple: LOWER is better, so invert
-    if 'burn_multiple' in df.columns:
-        inverted = 1 / df['burn_multiple'].clip(lower=0.1)
-        result['burn_multiple_norm'] = normalize_to_100(inverted, min_val=0.1, max_val=3.0)
-    
-    # Runway: more is better
-    if 'runway_months' in df.columns:
-        result['runway_months_norm'] = normalize_to_100(
-            df['runway_months'].clip(0, 24), 
-            min_val=0, 
-            max_val=24
-        )
-    
+    result = _attach_norm_columns(df, _normalize_kpi_matrix(_kpi_matrix(df)))
     print("  KPIs normalized!")
     return result
 
@@ -76,21 +123,21 @@ def calculate_investment_score(
         print("\nCalculating Investment Scores...")
         print(f"  Weights: Rule40={weights['rule_of_40']:.0%}, Traction={weights['traction_index']:.0%}, CapEff={weights['capital_efficiency']:.0%}, Burn={weights['burn_multiple']:.0%}, Runway={weights['runway_months']:.0%}")
     
-    result = normalize_kpis(df)
+    print("  Normalizing KPIs...")
+    arr = _kpi_matrix(df)
+    # KPIs missing from df contribute nothing to the score
+    use = np.array([col in df.columns for col in KPI_COLUMNS])
+    w = np.array([weights.get(col, 0) for col in KPI_COLUMNS], dtype=np.float64)
     
     print("  Computing weighted score...")
-    score = pd.Series(0.0, index=result.index)
-    
-    if 'rule_of_40_norm' in result.columns:
-        score += result['rule_of_40_norm'] * weights.get('rule_of_40', 0)
-    if 'traction_index_norm' in result.columns:
-        score += result['traction_index_norm'] * weights.get('traction_index', 0)
-    if 'capital_efficiency_norm' in result.columns:
-        score += result['capital_efficiency_norm'] * weights.get('capital_efficiency', 0)
-    if 'burn_multiple_norm' in result.columns:
-        score += result['burn_multiple_norm'] * weights.get('burn_multiple', 0)
-    if 'runway_months_norm' in result.columns:
-        score += result['runway_months_norm'] * weights.get('runway_months', 0)
+    if _score_kernel is not None:
+        score = _score_kernel(arr, w, use)
+    else:
+        _normalize_kpi_matrix(arr)
+        score = arr[:, use] @ w[use]
+    
+    result = _attach_norm_columns(df, arr)
+    score = pd.Series(score, index=result.index)
     
     result['investment_score'] = score.round(2)
     
@@ -108,9 +155,10 @@ def rank_startups(
 ) -> pd.DataFrame:
     """Rank startups by score."""
     print("\nRanking startups...")
-    result = df.copy()
-    result = result.sort_values(score_col, ascending=ascending)
-    result['rank'] = range(1, len(result) + 1)
+    scores = df[score_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    order = np.argsort(scores if ascending else -scores, kind='stable')
+    result = df.take(order)
+    result['rank'] = np.arange(1, len(result) + 1, dtype=np.int32)
     print(f"  Ranked {len(result):,} startups")
     return result
 
@@ -120,18 +168,50 @@ def get_top_startups(
     score_col: str = 'investment_score'
 ) -> pd.DataFrame:
     """Get top N startups."""
-    ranked = rank_startups(df, score_col=score_col)
-    return ranked.head(n)
+    if n <= 0 or n >= len(df):
+        return rank_startups(df, score_col=score_col).head(n)
+    
+    # Partition out the n best scores (plus ties at the cutoff), then sort
+    # only those candidates; same order as rank_startups(df).head(n)
+    keys = -df[score_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    cutoff = np.partition(keys, n - 1)[n - 1]
+    if np.isnan(cutoff):
+        return rank_startups(df, score_col=score_col).head(n)
+    candidates = np.flatnonzero(keys <= cutoff)
+    idx = candidates[np.argsort(keys[candidates], kind='stable')[:n]]
+    
+    top = df.take(idx)
+    top['rank'] = np.arange(1, n + 1, dtype=np.int32)
+    return top
 
-def score_breakdown(df: pd.DataFrame, company_name: str) -> None:
-    """Print detailed score breakdown for a company."""
-    company = df[df['company'] == company_name]
-    
-    if len(company) == 0:
+def build_company_index(df: pd.DataFrame) -> Dict[str, int]:
+    """Map company name -> position of its first row, for repeated lookups."""
+    names = df['company'].to_numpy()
+    first = ~df['company'].duplicated().to_numpy()
+    return dict(zip(names[first], np.flatnonzero(first)))
+
+def score_breakdown(
+    df: pd.DataFrame, 
+    company_name: str, 
+    company_index: Optional[Dict[str, int]] = None
+) -> None:
+    """
+    Print detailed score breakdown for a company.
+    
+    Pass company_index from build_company_index(df) when drilling into many
+    companies of the same frame to avoid a full-column scan per call.
+    """
+    if company_index is not None:
+        pos = company_index.get(company_name)
+    else:
+        matches = np.flatnonzero(df['company'].to_numpy() == company_name)
+        pos = matches[0] if len(matches) else None
+    
+    if pos is None:
         print(f"Company not found: {company_name}")
         return
     
-    company = company.iloc[0]
+    company = df.iloc[pos]
     
     print(f"\n{'='*70}")
     print(f"SCORE BREAKDOWN: {company_name}")
@@ -198,32 +278,38 @@ def scoring_summary(df: pd.DataFrame) -> None:
         print("No investment_score column found")
         return
     
-    scores = df['investment_score']
+    scores = df['investment_score'].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = scores[~np.isnan(scores)]
+    if valid.size == 0:
+        print("No valid investment scores found")
+        return
+    
+    q_min, q25, q50, q75, q_max = np.percentile(valid, [0, 25, 50, 75, 100])
     
     print(f"\n{'='*70}")
     print("INVESTMENT SCORE SUMMARY")
     print(f"{'='*70}")
     
     print(f"\nScore Distribution:")
-    print(f"  Mean:      {scores.mean():>8.2f}")
-    print(f"  Median:    {scores.quantile(0.50):>8.2f}")
-    print(f"  Std Dev:   {scores.std():>8.2f}")
-    print(f"  Min:       {scores.min():>8.2f}")
-    print(f"  25th:      {scores.quantile(0.25):>8.2f}")
-    print(f"  75th:      {scores.quantile(0.75):>8.2f}")
-    print(f"  Max:       {scores.max():>8.2f}")
+    print(f"  Mean:      {valid.mean():>8.2f}")
+    print(f"  Median:    {q50:>8.2f}")
+    print(f"  Std Dev:   {valid.std(ddof=1):>8.2f}")
+    print(f"  Min:       {q_min:>8.2f}")
+    print(f"  25th:      {q25:>8.2f}")
+    print(f"  75th:      {q75:>8.2f}")
+    print(f"  Max:       {q_max:>8.2f}")
     
     print(f"\nScore Ranges:")
-    ranges = [
-        (80, 100, "Excellent (Top Tier)"),
-        (60, 80, "Strong (High Potential)"),
-        (40, 60, "Moderate (Average)"),
-        (20, 40, "Weak (Below Average)"),
-        (0, 20, "Poor (High Risk)")
+    labels = [
+        "Poor (High Risk)",
+        "Weak (Below Average)",
+        "Moderate (Average)",
+        "Strong (High Potential)",
+        "Excellent (Top Tier)",
     ]
+    counts = np.histogram(valid, bins=[0, 20, 40, 60, 80, 100])[0]
     
-    for min_score, max_score, label in ranges:
-        count = ((scores >= min_score) & (scores < max_score)).sum()
+    for label, count in zip(reversed(labels), reversed(counts)):
         pct = count / len(scores) * 100
         print(f"  {label:25s}: {count:>5,} ({pct:>5.1f}%)")
     
@@ -237,15 +323,28 @@ if __name__ == "__main__":
     from pathlib import Path
     
     input_file = Path("data/processed/startups_with_kpis.csv")
+    parquet_file = input_file.with_suffix('.parquet')
     
     print(f"Step 1: Checking file...")
-    if not input_file.exists():
+    if parquet_file.exists():
+        input_file = parquet_file
+    elif not input_file.exists():
         print(f"ERROR: File not found: {input_file}")
         exit(1)
     print(f"  File exists: {input_file}")
     
     print(f"\nStep 2: Loading data...")
-    df = pd.read_csv(input_file)
+    if input_file.suffix == '.parquet':
+        df = pd.read_parquet(input_file)
+    else:
+        df = pd.read_csv(input_file, engine='pyarrow')
+    
+    # Downcast wide numeric columns (pandas only downcasts when values fit)
+    for c in KPI_COLUMNS + ('funding_amount',):
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], downcast='float')
+    if 'investors_count' in df.columns:
+        df['investors_count'] = pd.to_numeric(df['investors_count'], downcast='integer')
     print(f"  Loaded {len(df):,} companies")
     
     print(f"\nStep 3: Calculating scores...")
@@ -276,12 +375,15 @@ if __name__ == "__main__":
     
     # Save results
     print(f"\nStep 6: Saving results...")
+    # CSV for downstream scripts, Parquet (typed, columnar) for fast reloads
     output_file = Path("data/processed/startups_scored.csv")
     df_ranked.to_csv(output_file, index=False)
-    print(f"  Saved: {output_file}")
+    df_ranked.to_parquet(output_file.with_suffix('.parquet'), compression='zstd', index=False)
+    print(f"  Saved: {output_file} (+ .parquet)")
     
     top_100_file = Path("data/processed/top_100_startups.csv")
     top_100.to_csv(top_100_file, index=False)
-    print(f"  Saved: {top_100_file}")
+    top_100.to_parquet(top_100_file.with_suffix('.parquet'), compression='zstd', index=False)
+    print(f"  Saved: {top_100_file} (+ .parquet)")
     
     print("\n=== SCRIPT COMPLETED SUCCESSFULLY ===")
\ No newline at end of file
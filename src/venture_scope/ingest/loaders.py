@@ -9,10 +9,20 @@ handling various naming conventions and ensuring data quality.
 """
 
 from __future__ import annotations
+import logging
+import sys
 from pathlib import Path
 from typing import Optional
 import pandas as pd
 
+try:
+    from .log_setup import Thousands
+except ImportError:  # run as a script: python loaders.py
+    from log_setup import Thousands
+
+logger = logging.getLogger(__name__)
+
+
 # ==================== CONSTANTS ====================
 
 CANONICAL_COLS = (
@@ -25,6 +35,11 @@ CANONICAL_COLS = (
     "founded_year",
 )
 
+# Files above this size are streamed in chunks of CHUNK_ROWS rows,
+# dropping non-company rows per chunk to bound peak memory
+CHUNKED_READ_BYTES = 1 << 30
+CHUNK_ROWS = 1_000_000
+
 STAGE_MAP = {
     "pre-seed": "Pre-Seed",
     "seed": "Seed",
@@ -39,29 +54,65 @@ STAGE_MAP = {
 
 # ==================== HELPER FUNCTIONS ====================
 
-def _standardize_stage(x: Optional[str]) -> Optional[str]:
+def _read_csv(path: Path) -> tuple[pd.DataFrame, int]:
     """
-    Standardize funding stage nomenclature.
+    Read a startup CSV, streaming large files in chunks.
+    
+    Files up to CHUNKED_READ_BYTES go through the multithreaded Arrow parser
+    in one call. Larger files are read CHUNK_ROWS rows at a time and, when
+    an entity_type column exists, non-company rows are dropped per chunk.
     
     Args:
-        x: Raw stage value
+        path: Path to the CSV file
     
     Returns:
-        Standardized stage name or None
-    
-    Examples:
-        >>> _standardize_stage("seed")
-        'Seed'
-        >>> _standardize_stage("SERIES A")
-        'Series A'
-        >>> _standardize_stage("")
-        None
+        (DataFrame, number of rows in the file)
     """
+    if path.stat().st_size <= CHUNKED_READ_BYTES:
+        df = pd.read_csv(path, engine="pyarrow")
+        return df, len(df)
+    
+    n_rows = 0
+    parts = []
+    for chunk in pd.read_csv(path, chunksize=CHUNK_ROWS):
+        n_rows += len(chunk)
+        if "entity_type" in chunk.columns:
+            chunk = chunk[chunk["entity_type"] == "Company"]
+        parts.append(chunk)
+    
+    return pd.concat(parts, ignore_index=True), n_rows
+
+
+def _stage_name(x: object) -> Optional[str]:
+    """Standardize a single stage value (None for blank or non-text values)."""
     if not isinstance(x, str) or not x.strip():
         return None
     return STAGE_MAP.get(x.lower().strip(), x.strip().title())
 
 
+def _standardize_stage(stage: pd.Series) -> pd.Series:
+    """
+    Standardize funding stage nomenclature.
+    
+    Known stages are mapped through STAGE_MAP, unknown ones are title-cased
+    and blank values become missing. Each distinct value is resolved once
+    and the results are spread back with its factorized codes.
+    
+    Args:
+        stage: Raw stage values
+    
+    Returns:
+        Series of standardized stage names
+    
+    Examples:
+        >>> _standardize_stage(pd.Series(["seed", "SERIES A", "", "growth"])).tolist()
+        ['Seed', 'Series A', <NA>, 'Growth']
+    """
+    codes, uniques = pd.factorize(stage)
+    names = pd.array([_stage_name(u) for u in uniques], dtype="string")
+    return pd.Series(names.take(codes, allow_fill=True), index=stage.index, name=stage.name)
+
+
 def _coalesce(df: pd.DataFrame, cands: list[str], new_col: str, verbose: bool = True) -> pd.Series:
     """
     Coalesce multiple candidate columns into one.
@@ -80,21 +131,54 @@ def _coalesce(df: pd.DataFrame, cands: list[str], new_col: str, verbose: bool =
     Example:
         >>> s = _coalesce(df, ["sector", "category", "industry"], "sector")
     """
-    s = pd.Series([None] * len(df))
-    found_cols = []
-    
-    for c in cands:
-        if c in df.columns:
-            s = s.fillna(df[c])
-            found_cols.append(c)
+    found_cols = [c for c in cands if c in df.columns]
     
     if verbose:
         if found_cols:
-            print(f"  ℹ️  Coalesced '{new_col}' from: {', '.join(found_cols)}")
+            logger.info("  ℹ️  Coalesced '%s' from: %s", new_col, ", ".join(found_cols))
         else:
-            print(f"  ⚠️  No candidate columns found for '{new_col}'")
+            logger.info("  ⚠️  No candidate columns found for '%s'", new_col)
+    
+    if not found_cols:
+        return pd.Series(pd.NA, index=df.index, name=new_col)
+    
+    # Row-wise backfill: first column holds the first non-null candidate
+    return df[found_cols].bfill(axis=1).iloc[:, 0].rename(new_col)
+
+
+def _to_numeric(s: pd.Series, downcast: str) -> pd.Series:
+    """
+    Coerce a column to numbers and downcast it.
+    
+    Already-numeric columns skip the parsing step. Downcasting only happens
+    when lossless, e.g. integer columns with missing values stay float64.
+    
+    Args:
+        s: Column to convert
+        downcast: "integer" or "float" (see pd.to_numeric)
+    
+    Returns:
+        Numeric Series
+    """
+    if not pd.api.types.is_numeric_dtype(s):
+        s = pd.to_numeric(s, errors="coerce")
+    return pd.to_numeric(s, downcast=downcast)
+
+
+def _year_from_date(dates: pd.Series) -> pd.Series:
+    """
+    Extract the year from YYYY-MM-DD dates without parsing full datetimes.
     
-    return s.rename(new_col)
+    Args:
+        dates: Date strings (or an already parsed datetime column)
+    
+    Returns:
+        Int16 Series of years (<NA> where the value doesn't start with a year)
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates.dt.year.astype("Int16")
+    year = dates.astype("string").str.slice(0, 4)
+    return year.where(year.str.isdigit()).astype("Int16")
 
 
 def _data_quality_report(df: pd.DataFrame) -> None:
@@ -104,19 +188,85 @@ def _data_quality_report(df: pd.DataFrame) -> None:
     Args:
         df: DataFrame to analyze
     """
-    print("\n📊 Data Quality Report:")
-    print("=" * 60)
+    logger.info("\n📊 Data Quality Report:")
+    logger.info("=" * 60)
     
-    for col in df.columns:
-        missing = df[col].isna().sum()
+    # One pass over the frame for all columns
+    missing_counts = df.isna().sum()
+    
+    for col, missing in missing_counts.items():
         pct = (missing / len(df)) * 100
         
         if pct > 0:
-            print(f"  {col:20s}: {missing:6,} missing ({pct:5.1f}%)")
+            logger.info("  %-20s: %6s missing (%5.1f%%)", col, Thousands(missing), pct)
         else:
-            print(f"  {col:20s}: ✅ Complete")
+            logger.info("  %-20s: ✅ Complete", col)
+    
+    logger.info("=" * 60)
+
+
+def _is_canonical(df: pd.DataFrame) -> bool:
+    """Whether df already has every canonical column, with numeric dtypes where expected."""
+    return set(CANONICAL_COLS).issubset(df.columns) and all(
+        pd.api.types.is_numeric_dtype(df[c])
+        for c in ("funding_amount", "investors_count", "founded_year")
+    )
+
+
+def _finalize(df: pd.DataFrame, keep: pd.Series, filter_funded: bool, verbose: bool) -> pd.DataFrame:
+    """
+    Apply the row filters and select the cleaned canonical columns.
+    
+    Args:
+        df: Harmonized DataFrame (all canonical columns present)
+        keep: Boolean row mask built so far (entity filter)
+        filter_funded: If True, also keep only companies with funding > $0
+        verbose: Whether to print progress messages
+    
+    Returns:
+        DataFrame with the canonical columns
+    """
+    # Optional: Filter only funded companies
+    #
+    # FILTERING DECISION: Remove companies with funding_amount <= 0
+    # 
+    # Rationale:
+    # - Crunchbase $0 values mostly represent MISSING DATA, not bootstrapped companies
+    # - Our KPIs (Rule of 40, Burn Multiple, Capital Efficiency) require funding data
+    # - Project scope: VC investment decision-making (not bootstrapped companies)
+    # 
+    # Trade-offs:
+    # - ✅ Cleaner dataset for VC-specific analysis
+    # - ✅ Enables calculation of funding-dependent KPIs
+    # - ❌ Introduces selection bias (excludes bootstrapped successes)
+    # - ❌ Reduces dataset size (~78% of companies filtered out)
+    # 
+    # This decision is documented in METHODOLOGY.md and the technical report.
+    if filter_funded:
+        before_filter = int(keep.sum())
+        keep = keep & (df['funding_amount'] > 0)
+        if verbose:
+            after_filter = int(keep.sum())
+            removed = before_filter - after_filter
+            logger.info("\n🔍 Filtered: Kept %s companies with funding > $0", Thousands(after_filter))
+            logger.info("   Removed: %s companies with $0 or missing funding", Thousands(removed))
+    
+    # Select rows and canonical columns in one pass, then clean
+    out = df.loc[keep, list(CANONICAL_COLS)]
+    
+    str_cols = ["company", "stage", "country", "sector"]
+    out = out.astype(dict.fromkeys(str_cols, "string"))
+    for c in str_cols:
+        out[c] = out[c].str.strip()
+    
+    # Low-cardinality labels as categoricals (int codes instead of strings)
+    out = out.astype(dict.fromkeys(["stage", "country", "sector"], "category"))
+    
+    if verbose:
+        logger.info("✨ Standardized to %s rows × %d columns", Thousands(len(out)), len(out.columns))
+        _data_quality_report(out)
     
-    print("=" * 60)
+    return out
 
 
 # ==================== MAIN LOADER ====================
@@ -134,6 +284,9 @@ def load_startups_csv(path: str | Path, verbose: bool = True, filter_funded: boo
     - Filters non-company entities (people, investors, products)
     - Optionally filters companies with funding_amount > $0
     
+    Input that already has every canonical column (numeric where expected),
+    such as a previously cleaned file, skips the harmonization steps.
+    
     Data Quality Decisions:
     ----------------------
     1. Entity Filtering: Only keeps entity_type == 'Company'
@@ -173,24 +326,33 @@ def load_startups_csv(path: str | Path, verbose: bool = True, filter_funded: boo
         raise FileNotFoundError(f"CSV file not found: {path}")
     
     if verbose:
-        print(f"📂 Loading startups from: {path.name}")
+        logger.info("📂 Loading startups from: %s", path.name)
     
-    # Load CSV with low_memory=False to avoid dtype warnings
-    df = pd.read_csv(path, low_memory=False)
+    df, n_rows = _read_csv(path)
     
-    if df.empty:
+    if n_rows == 0:
         raise ValueError(f"CSV file is empty: {path}")
     
     if verbose:
-        print(f"✅ Loaded {len(df):,} rows with {len(df.columns)} columns")
+        logger.info("✅ Loaded %s rows with %d columns", Thousands(n_rows), len(df.columns))
 
-     # CRITICAL: Filter only companies (not people, investors, products, etc.)
+    # Row filters are collected in one mask and applied once, together with
+    # the canonical column selection (no intermediate copies of the frame)
+    keep = pd.Series(True, index=df.index)
+    
+    # CRITICAL: Filter only companies (not people, investors, products, etc.)
     if 'entity_type' in df.columns:
-        original_count = len(df)
-        df = df[df['entity_type'] == 'Company'].copy()
+        keep &= df['entity_type'].eq('Company')
         if verbose:
-            filtered_count = original_count - len(df)
-            print(f"  🔍 Filtered out {filtered_count:,} non-company entities (kept only Companies)")
+            filtered_count = n_rows - int(keep.sum())
+            logger.info("  🔍 Filtered out %s non-company entities (kept only Companies)", Thousands(filtered_count))
+    
+    # Fast path: already-canonical input (e.g. a re-load of cleaned output)
+    # skips the harmonization stage below
+    if _is_canonical(df):
+        if verbose:
+            logger.info("  ⚡ Canonical columns found, skipping harmonization")
+        return _finalize(df, keep, filter_funded, verbose)
     
     # Find and rename company column
     if "company" not in df.columns:
@@ -198,13 +360,13 @@ def load_startups_csv(path: str | Path, verbose: bool = True, filter_funded: boo
             if cand in df.columns:
                 df = df.rename(columns={cand: "company"})
                 if verbose:
-                    print(f"  ℹ️  Renamed '{cand}' → 'company'")
+                    logger.info("  ℹ️  Renamed '%s' → 'company'", cand)
                 break
     
     # Standardize stage
     if "stage" not in df.columns:
         df["stage"] = None
-    df["stage"] = df["stage"].apply(_standardize_stage)
+    df["stage"] = _standardize_stage(df["stage"])
     
     # Harmonize sector and country
     if "sector" not in df.columns:
@@ -218,6 +380,7 @@ def load_startups_csv(path: str | Path, verbose: bool = True, filter_funded: boo
         "investors_count": ["investors_count", "investor_count", "participants"],
         "founded_year": ["founded_year", "founded_at"]
     }
+    downcast = {"funding_amount": "float", "investors_count": "integer", "founded_year": "integer"}
     
     for target_col, candidates in numeric_mapping.items():
         if target_col not in df.columns:
@@ -225,69 +388,36 @@ def load_startups_csv(path: str | Path, verbose: bool = True, filter_funded: boo
                 if cand in df.columns:
                     if cand == "founded_at":
                         # Extract year from date
-                        df[target_col] = pd.to_datetime(df[cand], errors="coerce").dt.year
+                        df[target_col] = _year_from_date(df[cand])
                         if verbose:
-                            print(f"  ℹ️  Extracted year from '{cand}' → '{target_col}'")
+                            logger.info("  ℹ️  Extracted year from '%s' → '%s'", cand, target_col)
                     else:
-                        df[target_col] = pd.to_numeric(df[cand], errors="coerce")
+                        df[target_col] = _to_numeric(df[cand], downcast[target_col])
                         if verbose:
-                            print(f"  ℹ️  Mapped '{cand}' → '{target_col}'")
+                            logger.info("  ℹ️  Mapped '%s' → '%s'", cand, target_col)
                     break
         else:
             # Column already exists, just convert type
-            df[target_col] = pd.to_numeric(df[target_col], errors="coerce")
+            df[target_col] = _to_numeric(df[target_col], downcast[target_col])
     
     # Ensure all canonical columns exist
     for c in CANONICAL_COLS:
         if c not in df.columns:
             df[c] = pd.NA
     
-    # Select and clean
-    out = df[list(CANONICAL_COLS)].copy()
-    
-    for c in ("company", "stage", "country", "sector"):
-        out[c] = out[c].astype("string").str.strip()
-    
-    # Optional: Filter only funded companies
-    if filter_funded:
-        if verbose:
-            before_filter = len(out)
-    
-    # FILTERING DECISION: Remove companies with funding_amount <= 0
-    # 
-    # Rationale:
-    # - Crunchbase $0 values mostly represent MISSING DATA, not bootstrapped companies
-    # - Our KPIs (Rule of 40, Burn Multiple, Capital Efficiency) require funding data
-    # - Project scope: VC investment decision-making (not bootstrapped companies)
-    # 
-    # Trade-offs:
-    # - ✅ Cleaner dataset for VC-specific analysis
-    # - ✅ Enables calculation of funding-dependent KPIs
-    # - ❌ Introduces selection bias (excludes bootstrapped successes)
-    # - ❌ Reduces dataset size (~78% of companies filtered out)
-    # 
-    # This decision is documented in METHODOLOGY.md and the technical report.
-    
-    out = out[out['funding_amount'] > 0].copy()
-    
-    if verbose:
-        after_filter = len(out)
-        removed = before_filter - after_filter
-        print(f"\n🔍 Filtered: Kept {after_filter:,} companies with funding > $0")
-        print(f"   Removed: {removed:,} companies with $0 or missing funding")
-    
-    if verbose:
-        print(f"✨ Standardized to {len(out):,} rows × {len(out.columns)} columns")
-        _data_quality_report(out)
-    
-    return out
+    return _finalize(df, keep, filter_funded, verbose)
 
 
 # ==================== TESTING ====================
 
 if __name__ == "__main__":
     # Test rapide si le fichier est exécuté directement
-    import sys
+    try:
+        from .log_setup import configure_logging
+    except ImportError:  # run as a script
+        from log_setup import configure_logging
+    
+    configure_logging()
     
     if len(sys.argv) > 1:
         test_path = sys.argv[1]
@@ -10,10 +10,26 @@ This module loads objects.csv and enriches it with:
 """
 
 from __future__ import annotations
+import json
+import logging
+import sys
 from pathlib import Path
 import pandas as pd
 from typing import Optional
 
+try:
+    import polars as pl
+except ImportError:  # pandas fallback below
+    pl = None
+
+try:
+    from .log_setup import Thousands
+except ImportError:  # run as a script: python loaders_enriched.py
+    from log_setup import Thousands
+
+logger = logging.getLogger(__name__)
+
+
 # Map Crunchbase funding types to standard stages
 STAGE_MAP = {
     "seed": "Seed",
@@ -32,12 +48,36 @@ STAGE_MAP = {
     "private-equity": "Series D+",
 }
 
+# Columns (and dtypes) read from each Crunchbase CSV
+OBJECTS_SCHEMA = {
+    "id": "string",
+    "name": "string",
+    "entity_type": "category",
+    "category_code": "string",
+    "country_code": "string",
+    "founded_at": "string",
+    "funding_total_usd": "float64",
+    "status": "string",
+}
+SOURCE_FILES = ("objects.csv", "funding_rounds.csv", "investments.csv")
+
+# Low-cardinality output columns returned as categoricals of strings
+LABEL_COLS = ("stage", "country", "sector", "status")
+ROUNDS_COLS = ["object_id", "funding_round_type", "funded_at"]
+INVESTMENTS_COLS = ["funded_object_id", "investor_object_id"]
+
+# objects.csv files above this size are streamed in chunks of CHUNK_ROWS
+# rows, dropping non-company rows per chunk to bound peak memory
+CHUNKED_READ_BYTES = 1 << 30
+CHUNK_ROWS = 1_000_000
+
 
 def load_enriched_startups(
     data_dir: str | Path,
     filter_funded: bool = True,
     min_funding: float = 0,
-    verbose: bool = True
+    verbose: bool = True,
+    cache: Optional[str | Path] = None
 ) -> pd.DataFrame:
     """
     Load Crunchbase data with enrichment from multiple sources.
@@ -47,6 +87,8 @@ def load_enriched_startups(
         filter_funded: Keep only companies with funding > min_funding
         min_funding: Minimum funding threshold
         verbose: Print progress
+        cache: Optional Parquet file caching the result. It is reused while
+            the source CSVs (mtime, size) and filter options are unchanged.
     
     Returns:
         Enriched DataFrame with stage and investors_count
@@ -57,174 +99,364 @@ def load_enriched_startups(
     """
     data_dir = Path(data_dir)
     
+    # ==================== CACHE ====================
+    
+    if cache is not None:
+        cache = Path(cache)
+        cache_key = _cache_key(data_dir, filter_funded, min_funding)
+        if _read_cache_key(cache) == cache_key:
+            result = pd.read_parquet(cache)
+            # Parquet doesn't keep the categories' string dtype; restore it so
+            # a cache hit returns the same dtypes as a fresh load
+            for col in LABEL_COLS:
+                categories = result[col].cat.categories.astype('string')
+                result[col] = result[col].cat.set_categories(categories)
+            if verbose:
+                logger.info("⚡ Loaded cached enriched data from: %s", cache)
+                logger.info("\n✨ Final dataset: %s companies × %d columns", Thousands(len(result)), len(result.columns))
+                _data_quality_report(result)
+            return result
+    
+    if verbose:
+        logger.info("📂 Loading enriched Crunchbase data...\n")
+    
+    if pl is not None:
+        df = _merge_sources_polars(data_dir, verbose)
+    else:
+        df = _merge_sources_pandas(data_dir, verbose)
+    
+    # ==================== STANDARDIZE & CLEAN ====================
+    
+    # Extract founded year (YYYY-MM-DD → first 4 chars, no datetime parse)
+    year = df['founded_at'].astype('string').str.slice(0, 4)
+    df['founded_year'] = year.where(year.str.isdigit()).astype('Int16')
+    
+    # Rename columns to standard names
+    df = df.rename(columns={
+        'name': 'company',
+        'category_code': 'sector',
+        'country_code': 'country',
+        'funding_total_usd': 'funding_amount'
+    })
+    
+    # Select final columns
+    result = df[[
+        'company', 'stage', 'country', 'sector', 
+        'funding_amount', 'investors_count', 'founded_year',
+        'status', 'last_funding_date'
+    ]]
+    
+   # ==================== FILTER ====================
+
+    if filter_funded:
+        before = len(result)
+        
+        # CRITICAL: Always filter > 0 to exclude missing data ($0)
+        # Most $0 values in Crunchbase represent missing data, not true $0 funding
+        keep = result['funding_amount'] > 0
+        
+        # If min_funding is specified and > 0, apply additional threshold
+        if min_funding > 0:
+            keep &= result['funding_amount'] >= min_funding
+        
+        result = result[keep]
+        
+        if verbose:
+            logger.info("\n🔍 Filtered: Kept %s companies with funding > $%s",
+                        Thousands(len(result)), Thousands(max(min_funding, 0)))
+            logger.info("   Removed: %s companies", Thousands(before - len(result)))
+    
+    # ==================== CONVERT TYPES ====================
+    
+    # Low-cardinality labels as categoricals of strings (after filtering,
+    # so only the values still present become categories)
+    result = result.astype({
+        'company': 'string', **dict.fromkeys(LABEL_COLS, 'string')
+    }).astype(dict.fromkeys(LABEL_COLS, 'category'))
+    
+    if cache is not None:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        result.to_parquet(cache, compression='zstd')
+        _cache_key_path(cache).write_text(json.dumps(cache_key))
+        if verbose:
+            logger.info("\n💾 Cached result to: %s", cache)
+    
+    # ==================== REPORT ====================
+    
     if verbose:
-        print("📂 Loading enriched Crunchbase data...\n")
+        logger.info("\n✨ Final dataset: %s companies × %d columns", Thousands(len(result)), len(result.columns))
+        _data_quality_report(result)
+    
+    return result
+
+
+def _cache_key(data_dir: Path, filter_funded: bool, min_funding: float) -> dict:
+    """Identify a load by its source files (mtime, size) and filter options."""
+    sources = {}
+    for name in SOURCE_FILES:
+        stat = (data_dir / name).stat()
+        sources[name] = [stat.st_mtime_ns, stat.st_size]
+    return {
+        "sources": sources,
+        "filter_funded": filter_funded,
+        "min_funding": min_funding,
+    }
+
+
+def _cache_key_path(cache: Path) -> Path:
+    return cache.with_suffix(".cache_key.json")
+
+
+def _read_cache_key(cache: Path) -> Optional[dict]:
+    """Return the key stored next to a cache file, or None if there is none."""
+    key_path = _cache_key_path(cache)
+    if not (cache.exists() and key_path.exists()):
+        return None
+    try:
+        return json.loads(key_path.read_text())
+    except json.JSONDecodeError:
+        return None
+
+
+def _read_companies(path: Path) -> tuple[pd.DataFrame, int]:
+    """
+    Read the company rows of objects.csv.
+    
+    Files up to CHUNKED_READ_BYTES are parsed in one call by the Arrow
+    engine; larger ones are streamed in chunks and filtered per chunk, so
+    the unfiltered table is never held in memory at once.
+    
+    Returns:
+        (companies without the entity_type column, number of objects read)
+    """
+    read_kwargs = dict(usecols=list(OBJECTS_SCHEMA), dtype=OBJECTS_SCHEMA)
+    
+    if path.stat().st_size <= CHUNKED_READ_BYTES:
+        chunks = [pd.read_csv(path, engine="pyarrow", **read_kwargs)]
+    else:
+        chunks = pd.read_csv(path, chunksize=CHUNK_ROWS, **read_kwargs)
+    
+    n_objects = 0
+    parts = []
+    for chunk in chunks:
+        n_objects += len(chunk)
+        parts.append(chunk[chunk['entity_type'] == 'Company'].drop(columns='entity_type'))
     
+    return pd.concat(parts, ignore_index=True), n_objects
+
+
+def _merge_sources_pandas(data_dir: Path, verbose: bool) -> pd.DataFrame:
+    """Load the three Crunchbase CSVs with pandas and merge them per company."""
     # ==================== LOAD OBJECTS (COMPANIES) ====================
     
     if verbose:
-        print("  ├─ Step 1/4: Loading objects.csv (companies)...")
+        logger.info("  ├─ Step 1/4: Loading objects.csv (companies)...")
     
-    objects = pd.read_csv(
-        data_dir / "objects.csv",
-        low_memory=False
-    )
+    companies, original = _read_companies(data_dir / "objects.csv")
     
-    # Filter only companies
-    if 'entity_type' in objects.columns:
-        original = len(objects)
-        objects = objects[objects['entity_type'] == 'Company'].copy()
-        if verbose:
-            print(f"    ✓ Filtered to {len(objects):,} companies (removed {original - len(objects):,} non-companies)")
+    if verbose:
+        logger.info("    ✓ Filtered to %s companies (removed %s non-companies)",
+                    Thousands(len(companies)), Thousands(original - len(companies)))
     
-    # Select relevant columns
-    companies = objects[[
-        'id', 'name', 'category_code', 'country_code', 
-        'founded_at', 'funding_total_usd', 'status'
-    ]].copy()
+    # Rounds and investments of non-companies are dropped before any grouping
+    company_ids = pd.Index(companies['id'].unique())
     
     # ==================== LOAD FUNDING ROUNDS ====================
     
     if verbose:
-        print("  ├─ Step 2/4: Loading funding_rounds.csv (stages)...")
+        logger.info("  ├─ Step 2/4: Loading funding_rounds.csv (stages)...")
     
     rounds = pd.read_csv(
         data_dir / "funding_rounds.csv",
-        low_memory=False
+        engine="pyarrow",
+        usecols=ROUNDS_COLS,
+        dtype={"object_id": "string", "funding_round_type": "string"},
+        parse_dates=["funded_at"]
     )
     
     if verbose:
-        print(f"    ✓ Loaded {len(rounds):,} funding rounds")
+        logger.info("    ✓ Loaded %s funding rounds", Thousands(len(rounds)))
+    
+    rounds = rounds[rounds['object_id'].isin(company_ids)]
     
     # Get the LAST (most recent) round for each company
-    rounds_sorted = rounds.sort_values('funded_at')
-    last_rounds = rounds_sorted.groupby('object_id').last().reset_index()
-    last_rounds = last_rounds[['object_id', 'funding_round_type', 'funded_at']]
-    last_rounds.columns = ['id', 'last_round_type', 'last_funding_date']
+    # (undated rounds sort first so any dated round wins; ties keep file order)
+    latest = (
+        rounds.sort_values('funded_at', kind='stable', na_position='first')
+        .drop_duplicates('object_id', keep='last')
+    )
+    
+    # Standardize stage names (resolved once per distinct round type)
+    round_types = latest['funding_round_type'].dropna().unique()
+    stage_lut = {t: STAGE_MAP.get(t.lower().strip()) for t in round_types}
     
-    # Standardize stage names
-    last_rounds['stage'] = last_rounds['last_round_type'].str.lower().str.strip()
-    last_rounds['stage'] = last_rounds['stage'].map(STAGE_MAP)
+    # Per-company table built in one go, keyed by the int32 company code
+    # used for merging below
+    last_rounds = pd.DataFrame({
+        'id_i': company_ids.get_indexer(latest['object_id']).astype('int32'),
+        'stage': latest['funding_round_type'].map(stage_lut),
+        'last_funding_date': latest['funded_at'],
+    })
     
     if verbose:
-        print(f"    ✓ Extracted stages for {len(last_rounds):,} companies")
+        logger.info("    ✓ Extracted stages for %s companies", Thousands(len(last_rounds)))
     
     # ==================== LOAD INVESTMENTS (INVESTOR COUNT) ====================
     
     if verbose:
-        print("  ├─ Step 3/4: Loading investments.csv (investor counts)...")
+        logger.info("  ├─ Step 3/4: Loading investments.csv (investor counts)...")
     
     investments = pd.read_csv(
         data_dir / "investments.csv",
-        low_memory=False
+        engine="pyarrow",
+        usecols=INVESTMENTS_COLS,
+        dtype="string"
     )
     
     if verbose:
-        print(f"    ✓ Loaded {len(investments):,} investment records")
+        logger.info("    ✓ Loaded %s investment records", Thousands(len(investments)))
+    
+    investments = investments[investments['funded_object_id'].isin(company_ids)]
     
     # Count unique investors per company
-    investor_counts = investments.groupby('funded_object_id')['investor_object_id'].nunique().reset_index()
-    investor_counts.columns = ['id', 'investors_count']
+    investor_counts = (
+        investments.groupby('funded_object_id', sort=False)
+        .agg(investors_count=('investor_object_id', 'nunique'))
+        .reset_index()
+        .rename(columns={'funded_object_id': 'id'})
+    )
     
     if verbose:
-        print(f"    ✓ Counted investors for {len(investor_counts):,} companies")
+        logger.info("    ✓ Counted investors for %s companies", Thousands(len(investor_counts)))
     
     # ==================== MERGE ALL DATA ====================
     
     if verbose:
-        print("  └─ Step 4/4: Merging all data sources...")
+        logger.info("  └─ Step 4/4: Merging all data sources...")
     
-    # Merge companies with stages
-    df = companies.merge(last_rounds[['id', 'stage', 'last_funding_date']], on='id', how='left')
+    # Encode ids once as int32 positions among the company ids so both
+    # merges hash integers instead of id strings (last_rounds already is)
+    companies['id_i'] = company_ids.get_indexer(companies['id']).astype('int32')
+    investor_counts['id_i'] = company_ids.get_indexer(investor_counts['id']).astype('int32')
     
-    # Merge with investor counts
-    df = df.merge(investor_counts, on='id', how='left')
+    # Combine the two small per-company tables first, so the large companies
+    # frame is hash-probed and materialized by a single left merge
+    enrichment = last_rounds.merge(
+        investor_counts[['id_i', 'investors_count']], on='id_i', how='outer', sort=False
+    )
+    df = companies.merge(enrichment, on='id_i', how='left', sort=False).drop(columns='id_i')
     
     if verbose:
-        print(f"    ✓ Merged data: {len(df):,} companies")
+        logger.info("    ✓ Merged data: %s companies", Thousands(len(df)))
     
-    # ==================== STANDARDIZE & CLEAN ====================
-    
-    # Extract founded year
-    df['founded_year'] = pd.to_datetime(df['founded_at'], errors='coerce').dt.year
-    
-    # Rename columns to standard names
-    df = df.rename(columns={
-        'name': 'company',
-        'category_code': 'sector',
-        'country_code': 'country',
-        'funding_total_usd': 'funding_amount'
-    })
+    return df
+
+
+def _merge_sources_polars(data_dir: Path, verbose: bool) -> pd.DataFrame:
+    """
+    Polars version of _merge_sources_pandas.
     
-    # Select final columns
-    result = df[[
-        'company', 'stage', 'country', 'sector', 
-        'funding_amount', 'investors_count', 'founded_year',
-        'status', 'last_funding_date'
-    ]].copy()
+    The scans, groupbys and joins run as one lazy query on the streaming
+    engine; only the merged company table is converted to pandas.
+    """
+    if verbose:
+        logger.info("  ├─ Steps 1-3/4: Scanning objects, funding_rounds, investments (Polars)...")
+    
+    companies = (
+        pl.scan_csv(data_dir / "objects.csv", infer_schema=False)
+        .select(list(OBJECTS_SCHEMA))
+        .filter(pl.col("entity_type") == "Company")
+        .drop("entity_type")
+        .with_columns(pl.col("funding_total_usd").cast(pl.Float64, strict=False))
+    )
     
-    # Convert types
-    result['company'] = result['company'].astype('string')
-    result['stage'] = result['stage'].astype('string')
-    result['country'] = result['country'].astype('string')
-    result['sector'] = result['sector'].astype('string')
-    result['status'] = result['status'].astype('string')
+    # Rounds and investments of non-companies are dropped before any grouping
+    company_ids = companies.select("id").unique()
+    
+    # Latest round per company (same tie/undated handling as pandas)
+    last_rounds = (
+        pl.scan_csv(data_dir / "funding_rounds.csv", infer_schema=False)
+        .select(ROUNDS_COLS)
+        .join(company_ids, left_on="object_id", right_on="id", how="semi")
+        .with_columns(pl.col("funded_at").str.to_date(strict=False))
+        .group_by("object_id")
+        .agg(
+            pl.col("funding_round_type", "funded_at")
+            .sort_by("funded_at", nulls_last=False, maintain_order=True)
+            .last()
+        )
+        .select(
+            pl.col("object_id").alias("id"),
+            pl.col("funding_round_type")
+            .str.to_lowercase()
+            .str.strip_chars()
+            .replace_strict(STAGE_MAP, default=None)
+            .alias("stage"),
+            pl.col("funded_at").alias("last_funding_date"),
+        )
+    )
     
-   # ==================== FILTER ====================
-
-    if filter_funded:
-        before = len(result)
-        
-        # CRITICAL: Always filter > 0 to exclude missing data ($0)
-        # Most $0 values in Crunchbase represent missing data, not true $0 funding
-        result = result[result['funding_amount'] > 0].copy()
-        
-        # If min_funding is specified and > 0, apply additional threshold
-        if min_funding > 0:
-            result = result[result['funding_amount'] >= min_funding].copy()
-        
-        if verbose:
-            threshold_text = f"${min_funding:,.0f}" if min_funding > 0 else "$0"
-            print(f"\n🔍 Filtered: Kept {len(result):,} companies with funding > {threshold_text}")
-            print(f"   Removed: {before - len(result):,} companies")
+    investor_counts = (
+        pl.scan_csv(data_dir / "investments.csv", infer_schema=False)
+        .select(INVESTMENTS_COLS)
+        .join(company_ids, left_on="funded_object_id", right_on="id", how="semi")
+        .group_by("funded_object_id")
+        .agg(pl.col("investor_object_id").drop_nulls().n_unique().alias("investors_count"))
+        .rename({"funded_object_id": "id"})
+    )
     
-    # ==================== REPORT ====================
+    if verbose:
+        logger.info("  └─ Step 4/4: Merging all data sources...")
+    
+    df = (
+        companies
+        .join(last_rounds, on="id", how="left", maintain_order="left")
+        .join(investor_counts, on="id", how="left", maintain_order="left")
+        .collect(engine="streaming")
+        .to_pandas()
+    )
+    df["last_funding_date"] = df["last_funding_date"].astype("datetime64[us]")
     
     if verbose:
-        print(f"\n✨ Final dataset: {len(result):,} companies × {len(result.columns)} columns")
-        _data_quality_report(result)
+        logger.info("    ✓ Merged data: %s companies", Thousands(len(df)))
     
-    return result
+    return df
 
 
 def _data_quality_report(df: pd.DataFrame) -> None:
     """Print data quality summary."""
-    print("\n📊 Data Quality Report:")
-    print("=" * 60)
-    
-    for col in ['company', 'stage', 'country', 'sector', 'funding_amount', 'investors_count', 'founded_year']:
-        if col in df.columns:
-            missing = df[col].isna().sum()
-            pct = (missing / len(df)) * 100
-            
-            if pct == 0:
-                icon = "✅"
-            elif pct < 20:
-                icon = "🟢"
-            elif pct < 50:
-                icon = "🟡"
-            else:
-                icon = "🔴"
-            
-            print(f"  {icon} {col:25s}: {missing:7,} missing ({pct:5.1f}%)")
-    
-    print("=" * 60)
+    logger.info("\n📊 Data Quality Report:")
+    logger.info("=" * 60)
+    
+    cols = ['company', 'stage', 'country', 'sector', 'funding_amount', 'investors_count', 'founded_year']
+    missing_counts = df[[c for c in cols if c in df.columns]].isna().sum()
+    
+    for col, missing in missing_counts.items():
+        pct = (missing / len(df)) * 100
+        
+        if pct == 0:
+            icon = "✅"
+        elif pct < 20:
+            icon = "🟢"
+        elif pct < 50:
+            icon = "🟡"
+        else:
+            icon = "🔴"
+        
+        logger.info("  %s %-25s: %7s missing (%5.1f%%)", icon, col, Thousands(missing), pct)
+    
+    logger.info("=" * 60)
 
 
 # ==================== TESTING ====================
 
 if __name__ == "__main__":
-    import sys
+    try:
+        from .log_setup import configure_logging
+    except ImportError:  # run as a script
+        from log_setup import configure_logging
+    
+    configure_logging()
     
     if len(sys.argv) > 1:
         data_dir = sys.argv[1]
@@ -236,7 +468,8 @@ if __name__ == "__main__":
     df = load_enriched_startups(
         data_dir,
         filter_funded=True,
-        min_funding=0  # Keep all with funding > 0
+        min_funding=0,  # Keep all with funding > 0
+        cache=Path("data/processed/startups_enriched.parquet")
     )
     
     print(f"\n✅ Successfully loaded {len(df):,} companies!")
@@ -0,0 +1,38 @@
+"""
+Logging helpers shared by the Venture-Scope loaders.
+
+The loaders only emit records through their module loggers and never
+configure logging themselves; command-line entry points call
+configure_logging to show the progress messages on stdout.
+"""
+
+from __future__ import annotations
+import logging
+import sys
+
+
+class Thousands:
+    """
+    Number shown with thousands separators in %-style log messages.
+
+    Formatting happens in __str__, i.e. only when the record is emitted.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def __str__(self) -> str:
+        return f"{self.value:,.0f}"
+
+
+def configure_logging(verbose: bool = True) -> None:
+    """
+    Print log records as bare messages on stdout (for scripts only).
+
+    Args:
+        verbose: Show INFO-level progress if True, only warnings otherwise
+    """
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+    logging.getLogger().setLevel(logging.INFO if verbose else logging.WARNING)
@@ -7,30 +7,73 @@ application of data science / machine learning methods, including
 if necessary a formal model comparison procedure."
 """
 
+import io
+import sys
 import pandas as pd
 import numpy as np
 import pickle
 from pathlib import Path
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import StandardScaler
+from joblib import Parallel, cpu_count, delayed
+from scipy import sparse
+from sklearn.model_selection import StratifiedKFold, train_test_split, cross_val_score
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
 from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.svm import SVC
-from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score, 
-    roc_auc_score, confusion_matrix, classification_report
-)
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+from sklearn.svm import LinearSVC
+from sklearn.kernel_approximation import Nystroem
+from sklearn.pipeline import make_pipeline
+from sklearn.metrics import roc_auc_score, classification_report
 import time
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to the NumPy path
+    njit = None
+
 print("=" * 70)
 print("🔬 VENTURE-SCOPE: Formal Model Comparison")
 print("=" * 70)
 
+NUMERIC_FEATURES = [
+    'funding_amount', 'investors_count', 'rule_of_40', 
+    'traction_index', 'capital_efficiency', 'burn_multiple',
+    'runway_months', 'investment_score'
+]
+
+CATEGORICAL_FEATURES = ['stage', 'sector', 'country']
+
+# Outcome label per status; any other status (operating, ...) -> -1, excluded
+STATUS_LABELS = {'acquired': 1, 'ipo': 1, 'closed': 0}
+
+# Models whose training set is undersampled to at most 2 majority rows per
+# minority row (kernel methods: cost grows with n, not with class weights)
+UNDERSAMPLED_MODELS = {'Support Vector Machine': 0.5}
+
+# Models trained on the ordinal-coded matrix instead of the one-hot one
+# (native categorical splits); Random Forest stays on one-hot like model.py
+ORDINAL_MODELS = {'Gradient Boosting'}
+
+# Parse-time dtypes for the columns the comparison reads
+COLUMN_DTYPES = {
+    **{col: np.float32 for col in NUMERIC_FEATURES},  # investors_count has NaN
+    **{col: 'category' for col in CATEGORICAL_FEATURES},
+    'status': 'category',
+}
+
 
 # ==================== DATA LOADING ====================
 
-def load_data():
-    """Load processed data with KPIs."""
+def load_data(columns=None):
+    """
+    Load processed data with KPIs.
+    
+    Args:
+        columns: Columns to parse (default: model features + status).
+                 All other columns are skipped at read time.
+    
+    Returns:
+        DataFrame, or None if the scored CSV is missing
+    """
     data_path = Path("data/processed/startups_scored.csv")
     
     if not data_path.exists():
@@ -38,72 +81,135 @@ def load_data():
         print("   Run: python src/venture_scope/analysis/kpi_calculator.py")
         return None
     
-    df = pd.read_csv(data_path)
+    if columns is None:
+        columns = NUMERIC_FEATURES + CATEGORICAL_FEATURES + ['status']
+    
+    df = pd.read_csv(
+        data_path,
+        usecols=columns,
+        dtype={col: COLUMN_DTYPES[col] for col in columns if col in COLUMN_DTYPES},
+        engine='pyarrow'
+    )
     print(f"✅ Loaded {len(df):,} companies with KPIs")
     return df
 
 
 # ==================== FEATURE PREPARATION ====================
 
+if njit is not None:
+    @njit(parallel=True)
+    def _label_clean_kernel(codes, lut, num):
+        """
+        Fused label lookup + NaN fill over the rows of num.
+        
+        Writes labels[i] = lut[codes[i]] and, for rows with a known outcome
+        (label >= 0), replaces NaN in num with 0 in place. Returns the labels
+        and the number of NaNs filled.
+        """
+        labels = np.empty(codes.shape[0], dtype=np.int8)
+        n_nan = 0
+        for i in prange(codes.shape[0]):
+            label = lut[codes[i]] if codes[i] >= 0 else np.int8(-1)
+            labels[i] = label
+            if label < 0:
+                continue
+            for j in range(num.shape[1]):
+                if np.isnan(num[i, j]):
+                    num[i, j] = 0
+                    n_nan += 1
+        return labels, n_nan
+else:
+    _label_clean_kernel = None
+
+def _label_and_clean(status, num):
+    """
+    Build outcome labels from status and zero-fill NaNs of labelled rows.
+    
+    Args:
+        status: Status Series, one entry per row of num
+        num: (n, k) float32 numeric feature matrix, modified in place
+    
+    Returns:
+        labels (int8: 1 success, 0 failure, -1 unknown), NaNs filled
+    """
+    codes, uniques = pd.factorize(status)  # missing status -> code -1
+    lut = np.array([STATUS_LABELS.get(u, -1) for u in uniques], dtype=np.int8)
+    
+    if _label_clean_kernel is not None and len(lut):
+        return _label_clean_kernel(codes, lut, num)
+    
+    labels = np.where(codes >= 0, lut[codes] if len(lut) else -1, -1).astype(np.int8)
+    known_nan = np.isnan(num) & (labels >= 0)[:, None]
+    num[known_nan] = 0
+    return labels, int(known_nan.sum())
+
 def prepare_ml_data(df):
     """
     Prepare features and labels for ML models.
     
+    Builds two feature matrices over the same rows: a one-hot CSR matrix
+    for the linear, kernel and Random Forest models and a compact dense
+    matrix with ordinal category codes for Gradient Boosting.
+    
     Returns:
-        X_train, X_test, y_train, y_test, feature_names
+        X_train, X_test (float32 CSR, one-hot), X_tree_train, X_tree_test
+        (float32 dense, ordinal codes), y_train, y_test (int8 arrays),
+        feature_names
     """
-    # Filter to known outcomes
-    df_ml = df[df['status'].isin(['acquired', 'ipo', 'closed'])].copy()
+    numeric_features = NUMERIC_FEATURES
+    categorical_features = CATEGORICAL_FEATURES
+    
+    # Label rows and fill NaN with 0 for numeric features in one pass,
+    # then filter to known outcomes (acquired/ipo/closed)
+    num = df[numeric_features].to_numpy(dtype=np.float32, copy=True)
+    labels, n_nan = _label_and_clean(df['status'], num)
+    known = labels >= 0
     
-    # Create binary label
-    df_ml['success'] = (df_ml['status'].isin(['acquired', 'ipo'])).astype(int)
+    df_ml = df[known]
+    y = labels[known]
+    num = num[known]
     
     print(f"\n📊 ML Dataset:")
-    print(f"   Total: {len(df_ml):,} companies")
-    print(f"   Success: {df_ml['success'].sum():,} ({df_ml['success'].mean()*100:.1f}%)")
-    print(f"   Failure: {(1-df_ml['success']).sum():,} ({(1-df_ml['success'].mean())*100:.1f}%)")
-    
-    # Select features
-    numeric_features = [
-        'funding_amount', 'investors_count', 'rule_of_40', 
-        'traction_index', 'capital_efficiency', 'burn_multiple',
-        'runway_months', 'investment_score'
-    ]
-    
-    categorical_features = ['stage', 'sector', 'country']
-    
-    # One-hot encode categorical features
-    df_encoded = pd.get_dummies(
-        df_ml[numeric_features + categorical_features], 
-        columns=categorical_features,
-        drop_first=False
-    )
+    print(f"   Total: {len(y):,} companies")
+    print(f"   Success: {y.sum():,} ({y.mean()*100:.1f}%)")
+    print(f"   Failure: {len(y) - y.sum():,} ({(1-y.mean())*100:.1f}%)")
     
-    X = df_encoded
-    y = df_ml['success']
-
-    # Handle missing values (fill NaN with 0 for numeric, mean for others)
+    # Handle missing values (already zero-filled by _label_and_clean)
     print(f"\n🧹 Cleaning data...")
-    print(f"   NaN values before: {X.isna().sum().sum()}")
-
-    # Fill numeric NaN with 0
-    X = X.fillna(0)
-
-    print(f"   NaN values after: {X.isna().sum().sum()}")
+    print(f"   NaN values before: {n_nan}")
+    
+    print(f"   NaN values after: {np.isnan(num).sum()}")
     print(f"   ✅ Data cleaned!")
     
+    # One-hot encode categorical features into a sparse block and stack it
+    # next to the numeric block (CSR: only the non-zero dummies are stored)
+    encoder = OneHotEncoder(sparse_output=True, handle_unknown='ignore', dtype=np.float32)
+    cat = encoder.fit_transform(df_ml[categorical_features])
+    
+    X = sparse.hstack([sparse.csr_matrix(num), cat], format='csr')
+    feature_names = numeric_features + encoder.get_feature_names_out().tolist()
+    
+    # Gradient Boosting splits on integer category codes directly (missing
+    # and unseen categories -> -1), so it skips the one-hot expansion
+    ordinal = OrdinalEncoder(
+        handle_unknown='use_encoded_value', unknown_value=-1,
+        encoded_missing_value=-1, dtype=np.float32
+    )
+    codes = ordinal.fit_transform(df_ml[categorical_features])
+    X_tree = np.hstack([num, codes])
+    
     # Train/test split (stratified to maintain class balance)
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, 
+    X_train, X_test, X_tree_train, X_tree_test, y_train, y_test = train_test_split(
+        X, X_tree, y, 
         test_size=0.20, 
         random_state=42, 
         stratify=y
     )
     
-    print(f"\n✅ Features prepared: {X.shape[1]} features")
-    print(f"   Train: {len(X_train):,} | Test: {len(X_test):,}")
+    print(f"\n✅ Features prepared: {X.shape[1]} one-hot / {X_tree.shape[1]} tree features")
+    print(f"   Train: {X_train.shape[0]:,} | Test: {X_test.shape[0]:,}")
     
-    return X_train, X_test, y_train, y_test, X.columns.tolist()
+    return X_train, X_test, X_tree_train, X_tree_test, y_train, y_test, feature_names
 
 
 # ==================== MODEL DEFINITIONS ====================
@@ -112,12 +218,22 @@ def get_models():
     """
     Define models to compare.
     
+    Models with needs_scaling=True train on the scaled one-hot matrix,
+    ORDINAL_MODELS on the ordinal matrix (numeric block, then codes) and
+    the rest on the unscaled one-hot matrix.
+    
     Returns:
         Dictionary of {model_name: (model, needs_scaling)}
     """
+    # Column positions of the category codes in the tree matrix
+    categorical_idx = list(range(
+        len(NUMERIC_FEATURES), len(NUMERIC_FEATURES) + len(CATEGORICAL_FEATURES)
+    ))
+    
     models = {
         'Logistic Regression': (
             LogisticRegression(
+                solver='lbfgs',
                 max_iter=1000, 
                 random_state=42,
                 class_weight='balanced'  # Handle class imbalance
@@ -126,37 +242,48 @@ def get_models():
         ),
         
         'Random Forest': (
+            # Same configuration and one-hot features as the production
+            # model (model.py)
             RandomForestClassifier(
                 n_estimators=100,
                 max_depth=10,
                 min_samples_split=20,
                 min_samples_leaf=10,
                 random_state=42,
-                n_jobs=-1
+                n_jobs=1  # Models already train in parallel (compare_models)
             ),
             False  # Tree-based, no scaling needed
         ),
         
         'Gradient Boosting': (
-            GradientBoostingClassifier(
-                n_estimators=100,
+            HistGradientBoostingClassifier(
+                max_iter=100,
                 learning_rate=0.1,
                 max_depth=5,
-                min_samples_split=20,
                 min_samples_leaf=10,
-                random_state=42
+                random_state=42,
+                early_stopping=True,
+                categorical_features=categorical_idx
             ),
             False  # Tree-based, no scaling needed
         ),
         
         'Support Vector Machine': (
-            SVC(
-                kernel='rbf',
-                C=1.0,
-                gamma='scale',
-                random_state=42,
-                probability=True,  # Enable probability estimates
-                class_weight='balanced'
+            # Nystroem maps the RBF kernel onto 300 features so a linear SVM
+            # can fit it in O(n) instead of SVC's O(n^2)-O(n^3) kernel solve.
+            # No probability calibration: ROC-AUC uses decision_function
+            make_pipeline(
+                Nystroem(
+                    kernel='rbf',
+                    gamma=None,  # 1/n_features, ~'scale' on standardized X
+                    n_components=300,
+                    random_state=42
+                ),
+                LinearSVC(
+                    C=1.0,
+                    class_weight='balanced',
+                    dual='auto'
+                )
             ),
             True  # Needs feature scaling
         )
@@ -167,46 +294,74 @@ def get_models():
 
 # ==================== MODEL TRAINING & EVALUATION ====================
 
-def train_and_evaluate(model, X_train, X_test, y_train, y_test, needs_scaling=False):
+def _undersample_majority(X, y, ratio, random_state=42):
+    """
+    Randomly drop majority-class rows until minority/majority >= ratio.
+    
+    Training-set only; row order is kept. Returns X, y unchanged if the
+    classes are already within ratio.
+    """
+    counts = np.bincount(y, minlength=2)
+    majority = counts.argmax()
+    n_keep = int(counts.min() / ratio)
+    if counts[majority] <= n_keep:
+        return X, y
+    
+    rng = np.random.default_rng(random_state)
+    drop = rng.choice(np.flatnonzero(y == majority), counts[majority] - n_keep, replace=False)
+    mask = np.ones(len(y), dtype=bool)
+    mask[drop] = False
+    return X[mask], y[mask]
+
+
+def train_and_evaluate(model, X_train_scaled, X_test_scaled, y_train, y_test):
     """
     Train model and evaluate performance.
     
+    Features must already be scaled if the model needs it (see compare_models).
+    
     Returns:
         Dictionary with all evaluation metrics
     """
-    # Scale features if needed
-    if needs_scaling:
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
-    else:
-        X_train_scaled = X_train
-        X_test_scaled = X_test
-    
     # Train
     start_time = time.time()
     model.fit(X_train_scaled, y_train)
     training_time = time.time() - start_time
     
-    # Predict
-    y_pred = model.predict(X_test_scaled)
-    y_pred_proba = model.predict_proba(X_test_scaled)[:, 1]
+    # Predict (one inference pass; hard labels from the same scores).
+    # Models without predict_proba are ranked by their decision function,
+    # which gives the same ROC-AUC as any monotone calibration of it
+    if hasattr(model, 'predict_proba'):
+        y_pred_proba = model.predict_proba(X_test_scaled)[:, 1]
+        y_pred = (y_pred_proba >= 0.5).astype(np.int8)
+    else:
+        y_pred_proba = model.decision_function(X_test_scaled)
+        y_pred = (y_pred_proba > 0).astype(np.int8)
+    
+    # Calculate metrics (all label metrics come from the 2x2 confusion matrix,
+    # counted with one bincount over the 0/1 label pairs)
+    cm = np.bincount(
+        2 * y_test.astype(np.int64) + y_pred, minlength=4
+    ).reshape(2, 2)
+    tn, fp, fn, tp = cm.ravel()
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
     
-    # Calculate metrics
     metrics = {
-        'accuracy': accuracy_score(y_test, y_pred),
-        'precision': precision_score(y_test, y_pred),
-        'recall': recall_score(y_test, y_pred),
-        'f1_score': f1_score(y_test, y_pred),
+        'accuracy': (tp + tn) / cm.sum(),
+        'precision': precision,
+        'recall': recall,
+        'f1_score': 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
         'roc_auc': roc_auc_score(y_test, y_pred_proba),
         'training_time': training_time,
-        'confusion_matrix': confusion_matrix(y_test, y_pred)
+        'confusion_matrix': cm
     }
     
-    # Cross-validation score (on training set)
+    # Cross-validation score (on training set; folds fit in parallel)
+    cv = StratifiedKFold(n_splits=3, shuffle=True, random_state=42)
     cv_scores = cross_val_score(
         model, X_train_scaled, y_train, 
-        cv=5, scoring='f1'
+        cv=cv, scoring='f1', n_jobs=-1
     )
     metrics['cv_f1_mean'] = cv_scores.mean()
     metrics['cv_f1_std'] = cv_scores.std()
@@ -216,7 +371,7 @@ def train_and_evaluate(model, X_train, X_test, y_train, y_test, needs_scaling=Fa
 
 # ==================== RESULTS COMPARISON ====================
 
-def compare_models(X_train, X_test, y_train, y_test):
+def compare_models(X_train, X_test, X_tree_train, X_tree_test, y_train, y_test):
     """
     Train and compare all models.
     
@@ -226,16 +381,43 @@ def compare_models(X_train, X_test, y_train, y_test):
     models = get_models()
     results = []
     
+    # Fit the scaler once; every model that needs scaling reuses the result
+    scaler = StandardScaler(with_mean=False)  # keeps X sparse
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+    
     print("\n" + "=" * 70)
     print("🔬 Training & Evaluating Models")
     print("=" * 70)
     
-    for model_name, (model, needs_scaling) in models.items():
-        print(f"\n⏳ Training {model_name}...")
+    def _run(model_name, model, needs_scaling):
+        if needs_scaling:
+            X_tr, X_te = X_train_scaled, X_test_scaled
+        elif model_name in ORDINAL_MODELS:
+            X_tr, X_te = X_tree_train, X_tree_test
+        else:
+            X_tr, X_te = X_train, X_test
         
-        metrics, trained_model = train_and_evaluate(
-            model, X_train, X_test, y_train, y_test, needs_scaling
-        )
+        # SVM-specific training subsample; the test set is never resampled
+        y_tr = y_train
+        if model_name in UNDERSAMPLED_MODELS:
+            X_tr, y_tr = _undersample_majority(X_tr, y_tr, UNDERSAMPLED_MODELS[model_name])
+        
+        metrics, _ = train_and_evaluate(model, X_tr, X_te, y_tr, y_test)
+        return model_name, metrics
+    
+    # Train all models concurrently: wall time ~ slowest model, not the sum
+    print(f"\n⏳ Training {len(models)} models in parallel...")
+    n_jobs = min(len(models), cpu_count())
+    runs = Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_run)(model_name, model, needs_scaling)
+        for model_name, (model, needs_scaling) in models.items()
+    )
+    
+    # Collect the per-model report and write it to stdout once
+    buf = io.StringIO()
+    for model_name, metrics in runs:
+        print(f"\n📈 {model_name}", file=buf)
         
         results.append({
             'Model': model_name,
@@ -249,12 +431,14 @@ def compare_models(X_train, X_test, y_train, y_test):
             'Training Time (s)': metrics['training_time']
         })
         
-        print(f"   ✅ Accuracy:  {metrics['accuracy']:.4f}")
-        print(f"   ✅ Precision: {metrics['precision']:.4f}")
-        print(f"   ✅ Recall:    {metrics['recall']:.4f}")
-        print(f"   ✅ F1-Score:  {metrics['f1_score']:.4f}")
-        print(f"   ✅ ROC-AUC:   {metrics['roc_auc']:.4f}")
-        print(f"   ⏱️  Time:      {metrics['training_time']:.2f}s")
+        print(f"   ✅ Accuracy:  {metrics['accuracy']:.4f}", file=buf)
+        print(f"   ✅ Precision: {metrics['precision']:.4f}", file=buf)
+        print(f"   ✅ Recall:    {metrics['recall']:.4f}", file=buf)
+        print(f"   ✅ F1-Score:  {metrics['f1_score']:.4f}", file=buf)
+        print(f"   ✅ ROC-AUC:   {metrics['roc_auc']:.4f}", file=buf)
+        print(f"   ⏱️  Time:      {metrics['training_time']:.2f}s", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
     
     df_results = pd.DataFrame(results)
     return df_results
@@ -264,28 +448,30 @@ def compare_models(X_train, X_test, y_train, y_test):
 
 def display_comparison(df_results):
     """Display formatted comparison table."""
-    print("\n" + "=" * 70)
-    print("📊 FORMAL MODEL COMPARISON RESULTS")
-    print("=" * 70)
-    print()
-    print(df_results.to_string(index=False))
-    print()
+    buf = io.StringIO()  # whole report is written to stdout once
+    
+    print("\n" + "=" * 70, file=buf)
+    print("📊 FORMAL MODEL COMPARISON RESULTS", file=buf)
+    print("=" * 70, file=buf)
+    print(file=buf)
+    print(df_results.to_string(index=False), file=buf)
+    print(file=buf)
     
     # Identify best model for each metric
-    print("=" * 70)
-    print("🏆 BEST MODELS BY METRIC")
-    print("=" * 70)
+    print("=" * 70, file=buf)
+    print("🏆 BEST MODELS BY METRIC", file=buf)
+    print("=" * 70, file=buf)
     
     metrics = ['Accuracy', 'Precision', 'Recall', 'F1-Score', 'ROC-AUC']
     for metric in metrics:
         best_idx = df_results[metric].idxmax()
         best_model = df_results.loc[best_idx, 'Model']
         best_value = df_results.loc[best_idx, metric]
-        print(f"  {metric:12s}: {best_model:25s} ({best_value:.4f})")
+        print(f"  {metric:12s}: {best_model:25s} ({best_value:.4f})", file=buf)
     
-    print("\n" + "=" * 70)
-    print("💡 RECOMMENDATION")
-    print("=" * 70)
+    print("\n" + "=" * 70, file=buf)
+    print("💡 RECOMMENDATION", file=buf)
+    print("=" * 70, file=buf)
     
     # For VC context, prioritize Recall (don't miss winners)
     best_recall_idx = df_results['Recall'].idxmax()
@@ -301,18 +487,31 @@ def display_comparison(df_results):
   - Venture capital is asymmetric: 1 unicorn >> 10 failures
   - Missing a winner (false negative) costs more than 
     investing in a failure (false positive)
-    """)
+    """, file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
 
 # ==================== SAVE RESULTS ====================
 
-def save_results(df_results):
-    """Save comparison results to CSV."""
+def save_results(df_results, fmt='csv'):
+    """
+    Save comparison results.
+    
+    Args:
+        df_results: Comparison table from compare_models
+        fmt: 'csv' (default) or 'parquet' (zstd-compressed, for sweeps that
+             save many result tables)
+    """
     output_dir = Path("outputs")
     output_dir.mkdir(exist_ok=True)
     
-    output_path = output_dir / "model_comparison.csv"
-    df_results.to_csv(output_path, index=False)
+    if fmt == 'parquet':
+        output_path = output_dir / "model_comparison.parquet"
+        df_results.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+    else:
+        output_path = output_dir / "model_comparison.csv"
+        df_results.to_csv(output_path, index=False)
     
     print(f"\n💾 Results saved to: {output_path}")
 
@@ -328,10 +527,13 @@ def main():
         return
     
     # Prepare ML data
-    X_train, X_test, y_train, y_test, feature_names = prepare_ml_data(df)
+    (X_train, X_test, X_tree_train, X_tree_test,
+     y_train, y_test, feature_names) = prepare_ml_data(df)
     
     # Compare models
-    df_results = compare_models(X_train, X_test, y_train, y_test)
+    df_results = compare_models(
+        X_train, X_test, X_tree_train, X_tree_test, y_train, y_test
+    )
     
     # Display results
     display_comparison(df_results)
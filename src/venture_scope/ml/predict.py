@@ -8,23 +8,25 @@ an ML-powered prediction of success probability based on historical patterns.
 Usage:
     python src/venture_scope/ml/predict.py
     
+Batch mode (CSV on stdin: funding_amount,stage,sector,country,investors_count,founded_year):
+    python src/venture_scope/ml/predict.py < startups.csv
+    
 Or interactively:
-    from venture_scope.ml.predict import predict_startup
+    from venture_scope.ml.predict import predict_startup, predict_startup_batch
     predict_startup(funding=10000000, stage='Series A', ...)
+    predict_startup_batch([{'funding_amount': 10000000, 'stage': 'Series A'}, ...])
 """
 
+import csv
+import math
 import pickle
-import pandas as pd
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 from pathlib import Path
-from typing import Dict, Tuple, Optional
-import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-print("🚀 VENTURE-SCOPE: Startup Success Predictor")
-print("=" * 70)
+from typing import Dict, List, Tuple, Optional
 
 
 # ==================== CONFIGURATION ====================
@@ -74,70 +76,93 @@ STAGE_DEFAULTS = {
     }
 }
 
+# STAGE_DEFAULTS as (burn_period, revenue_multiple, rule_40_base, stage_weight)
+# rows indexed by position in STAGES; unknown stages fall back to Series A
+_STAGE_INDEX = {stage: i for i, stage in enumerate(STAGES)}
+_DEFAULT_STAGE_IDX = _STAGE_INDEX['Series A']
+_STAGE_PARAMS = tuple(
+    (d['burn_period'], d['revenue_multiple'], d['rule_40_base'], d['stage_weight'])
+    for d in (STAGE_DEFAULTS[stage] for stage in STAGES)
+)
+
+# Valid stages for input validation (set membership instead of a list scan)
+_STAGES_SET = frozenset(STAGES)
+
+# Same table as per-parameter arrays for the batch path (gather by stage index)
+_BURN_PERIOD, _REV_MULT, _RULE40_BASE, _STAGE_WEIGHT = (
+    np.array(column, dtype=np.float64) for column in zip(*_STAGE_PARAMS)
+)
+
 
 # ==================== KPI CALCULATION ====================
 
-def calculate_kpis(
-    funding_amount: float,
-    stage: str,
-    investors_count: int,
-    founded_year: int,
-    current_year: int = 2025
-) -> Dict[str, float]:
+@dataclass(slots=True)
+class KPIs:
+    """KPIs estimated for one startup (see calculate_kpis)."""
+    estimated_revenue: float
+    capital_efficiency: float
+    monthly_burn: float
+    runway_months: float
+    burn_multiple: float
+    traction_index: float
+    rule_of_40: float
+    investment_score: float
+    age: int
+    
+    def as_dict(self) -> Dict[str, float]:
+        """KPI name -> value, same keys as calculate_kpis_batch plus 'age'."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _kpis_core(
+    funding_amount, burn_period, revenue_multiple, rule_40_base,
+    stage_weight, investors_count, age
+):
     """
-    Calculate KPIs for a startup based on basic inputs.
+    KPI arithmetic for one startup, given its stage parameters and age.
     
-    Args:
-        funding_amount: Total funding raised ($)
-        stage: Funding stage (Seed, Series A, etc.)
-        investors_count: Number of unique investors
-        founded_year: Year company was founded
-        current_year: Current year for age calculation
+    JIT-compiled with numba when available (see _compiled_kpis_core).
     
     Returns:
-        Dictionary with all calculated KPIs
+        (estimated_revenue, capital_efficiency, monthly_burn, runway_months,
+         burn_multiple, traction_index, rule_of_40, investment_score)
     """
-    defaults = STAGE_DEFAULTS.get(stage, STAGE_DEFAULTS['Series A'])
-    
-    # Company age
-    age = max(1, current_year - founded_year)
-    
     # Estimated Revenue
-    estimated_revenue = funding_amount * defaults['revenue_multiple']
+    estimated_revenue = funding_amount * revenue_multiple
     
     # Capital Efficiency
-    capital_efficiency = estimated_revenue / funding_amount if funding_amount > 0 else 0
+    capital_efficiency = estimated_revenue / funding_amount if funding_amount > 0 else 0.0
     capital_efficiency = min(1.0, capital_efficiency)  # Cap at 1.0
     
     # Monthly Burn
-    monthly_burn = funding_amount / defaults['burn_period']
+    monthly_burn = funding_amount / burn_period
     
     # Runway (assume 50% of funding still available)
     available_cash = funding_amount * 0.5
-    runway_months = available_cash / monthly_burn if monthly_burn > 0 else 0
-    runway_months = min(24, runway_months)  # Cap at 24 months
+    runway_months = available_cash / monthly_burn if monthly_burn > 0 else 0.0
+    runway_months = min(24.0, runway_months)  # Cap at 24 months
     
     # Burn Multiple
     annual_burn = monthly_burn * 12
-    burn_multiple = annual_burn / estimated_revenue if estimated_revenue > 0 else 10
-    burn_multiple = min(10, max(0.3, burn_multiple))  # Clip between 0.3 and 10
+    burn_multiple = annual_burn / estimated_revenue if estimated_revenue > 0 else 10.0
+    burn_multiple = min(10.0, max(0.3, burn_multiple))  # Clip between 0.3 and 10
     
     # Traction Index
-    funding_log = np.log10(max(100000, funding_amount))  # Min $100K
-    traction_raw = (funding_log * investors_count * defaults['stage_weight']) / age
-    traction_index = min(100, traction_raw)  # Scale to 0-100
+    funding_log = math.log10(max(100000.0, funding_amount))  # Min $100K
+    traction_raw = (funding_log * investors_count * stage_weight) / age
+    traction_index = min(100.0, traction_raw)  # Scale to 0-100
     
     # Rule of 40 (estimated)
     rule_40_adjustment = (capital_efficiency - 0.30) * 50
-    rule_of_40 = defaults['rule_40_base'] + rule_40_adjustment
-    rule_of_40 = max(0, min(150, rule_of_40))  # Clip 0-150
+    rule_of_40 = rule_40_base + rule_40_adjustment
+    rule_of_40 = max(0.0, min(150.0, rule_of_40))  # Clip 0-150
     
     # Investment Score (weighted combination)
-    rule_40_norm = min(100, rule_of_40)
+    rule_40_norm = min(100.0, rule_of_40)
     traction_norm = traction_index
     cap_eff_norm = capital_efficiency * 100
-    burn_norm = (1 / burn_multiple) * 50 if burn_multiple > 0 else 0
-    burn_norm = min(100, burn_norm)
+    burn_norm = (1 / burn_multiple) * 50 if burn_multiple > 0 else 0.0
+    burn_norm = min(100.0, burn_norm)
     runway_norm = (runway_months / 24) * 100
     
     investment_score = (
@@ -148,6 +173,138 @@ def calculate_kpis(
         runway_norm * 0.15
     )
     
+    return (
+        estimated_revenue, capital_efficiency, monthly_burn, runway_months,
+        burn_multiple, traction_index, rule_of_40, investment_score
+    )
+
+
+@lru_cache(maxsize=1)
+def _compiled_kpis_core():
+    """
+    _kpis_core JIT-compiled with numba, or as is if numba isn't installed.
+    
+    numba is imported on first use rather than at module import, where it
+    would dominate the start-up time of predict.py.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to pure Python
+        return _kpis_core
+    # No fastmath: keeps the compiled core bit-identical to the Python fallback
+    return njit(_kpis_core)
+
+
+def calculate_kpis(
+    funding_amount: float,
+    stage: str,
+    investors_count: int,
+    founded_year: int,
+    current_year: int = 2025
+) -> KPIs:
+    """
+    Calculate KPIs for a startup based on basic inputs.
+    
+    Args:
+        funding_amount: Total funding raised ($)
+        stage: Funding stage (Seed, Series A, etc.)
+        investors_count: Number of unique investors
+        founded_year: Year company was founded
+        current_year: Current year for age calculation
+    
+    Returns:
+        KPIs with all calculated values
+    """
+    burn_period, revenue_multiple, rule_40_base, stage_weight = _STAGE_PARAMS[
+        _STAGE_INDEX.get(stage, _DEFAULT_STAGE_IDX)
+    ]
+    
+    # Company age
+    age = max(1, current_year - founded_year)
+    
+    # Floats throughout so the JIT core compiles a single signature
+    return KPIs(*_compiled_kpis_core()(
+        float(funding_amount), float(burn_period), float(revenue_multiple),
+        float(rule_40_base), float(stage_weight), float(investors_count), float(age)
+    ), age)
+
+
+def calculate_kpis_batch(
+    funding: np.ndarray,
+    stage_idx: np.ndarray,
+    investors: np.ndarray,
+    founded_year: np.ndarray,
+    current_year: int = 2025
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized calculate_kpis for many startups at once.
+    
+    Args:
+        funding: Total funding raised ($) per startup
+        stage_idx: Position of each startup's stage in STAGES, -1 for an
+            unknown stage (Series A defaults, as in calculate_kpis)
+        investors: Number of unique investors
+        founded_year: Year each company was founded
+        current_year: Current year for age calculation
+    
+    Returns:
+        Dictionary of KPI name -> array, named like the KPIs fields
+    """
+    funding = np.asarray(funding, dtype=np.float64)
+    stage_idx = np.asarray(stage_idx, dtype=np.intp)
+    stage_idx = np.where(stage_idx < 0, _DEFAULT_STAGE_IDX, stage_idx)
+    investors = np.asarray(investors, dtype=np.float64)
+    founded_year = np.asarray(founded_year)
+    
+    # Company age
+    age = np.maximum(1, current_year - founded_year)
+    
+    # Estimated Revenue
+    estimated_revenue = funding * _REV_MULT[stage_idx]
+    
+    # Capital Efficiency (0 without funding), capped at 1.0
+    capital_efficiency = np.divide(
+        estimated_revenue, funding,
+        out=np.zeros_like(funding), where=funding > 0
+    )
+    capital_efficiency = np.minimum(1.0, capital_efficiency)
+    
+    # Monthly Burn
+    monthly_burn = funding / _BURN_PERIOD[stage_idx]
+    
+    # Runway (assume 50% of funding still available), capped at 24 months
+    runway_months = np.divide(
+        funding * 0.5, monthly_burn,
+        out=np.zeros_like(funding), where=monthly_burn > 0
+    )
+    runway_months = np.minimum(24, runway_months)
+    
+    # Burn Multiple (10 without revenue), clipped between 0.3 and 10
+    burn_multiple = np.divide(
+        monthly_burn * 12, estimated_revenue,
+        out=np.full_like(funding, 10.0), where=estimated_revenue > 0
+    )
+    burn_multiple = np.clip(burn_multiple, 0.3, 10)
+    
+    # Traction Index
+    funding_log = np.log10(np.maximum(100000, funding))  # Min $100K
+    traction_raw = (funding_log * investors * _STAGE_WEIGHT[stage_idx]) / age
+    traction_index = np.minimum(100, traction_raw)
+    
+    # Rule of 40 (estimated), clipped 0-150
+    rule_of_40 = _RULE40_BASE[stage_idx] + (capital_efficiency - 0.30) * 50
+    rule_of_40 = np.clip(rule_of_40, 0, 150)
+    
+    # Investment Score (weighted combination); burn_multiple >= 0.3 here
+    burn_norm = np.minimum(100, (1 / burn_multiple) * 50)
+    investment_score = (
+        np.minimum(100, rule_of_40) * 0.25 +
+        traction_index * 0.25 +
+        capital_efficiency * 100 * 0.20 +
+        burn_norm * 0.15 +
+        (runway_months / 24) * 100 * 0.15
+    )
+    
     return {
         'estimated_revenue': estimated_revenue,
         'capital_efficiency': capital_efficiency,
@@ -163,84 +320,232 @@ def calculate_kpis(
 
 # ==================== FEATURE ENGINEERING ====================
 
-def prepare_features(
-    funding_amount: float,
-    stage: str,
-    sector: str,
-    country: str,
-    investors_count: int,
-    founded_year: int,
-    kpis: Dict[str, float],
-    model
-) -> pd.DataFrame:
+NUMERIC_FEATURES = [
+    'funding_amount', 'investors_count', 'rule_of_40', 
+    'traction_index', 'capital_efficiency', 'burn_multiple',
+    'runway_months', 'investment_score'
+]
+
+
+def _feature_index(model) -> tuple:
     """
-    Prepare features in the format expected by the trained model.
+    Column layout of the model's input, built once and cached on the model.
     
-    Creates a DataFrame with ALL columns the model expects (113 total).
+    Returns:
+        (feature_names, numeric_cols, numeric_pos, stage_cols, sector_cols,
+        country_cols). numeric_cols is where the NUMERIC_FEATURES values go:
+        a slice when they are contiguous and all present, else an index array
+        with numeric_pos selecting the values the model has. The *_cols dicts
+        map a raw stage / sector / country value to its one-hot column.
+    
+    Raises:
+        ValueError: If the model has no feature names and expects a different
+            number of features than the fallback layout provides
     """
+    index = getattr(model, '_vs_feature_index', None)
+    if index is not None:
+        return index
+    
     # Get feature names from the trained model
     if hasattr(model, 'feature_names_in_'):
-        expected_features = model.feature_names_in_
+        feature_names = list(model.feature_names_in_)
     else:
         # Fallback: manually create expected feature list
         # This should match what was used during training
-        expected_features = []
-        
-        # Numeric features (8)
-        numeric_features = [
-            'funding_amount', 'investors_count', 'rule_of_40', 
-            'traction_index', 'capital_efficiency', 'burn_multiple',
-            'runway_months', 'investment_score'
-        ]
-        expected_features.extend(numeric_features)
+        feature_names = list(NUMERIC_FEATURES)
         
         # Stage features (one-hot encoded)
         for stage_val in ['Seed', 'Angel', 'Series A', 'Series B', 'Series C', 'Series D+']:
-            expected_features.append(f'stage_{stage_val}')
+            feature_names.append(f'stage_{stage_val}')
         
-        # We'll add sector and country dynamically based on what model has
+        # Sector and country columns can't be recovered without names, so
+        # stop here rather than feed the model a misaligned row
+        n_expected = getattr(model, 'n_features_in_', len(feature_names))
+        if n_expected != len(feature_names):
+            raise ValueError(
+                f"Model has no feature names and expects {n_expected} features; "
+                f"the fallback layout has {len(feature_names)}"
+            )
         print("⚠️  Warning: Could not get feature names from model, using fallback")
     
-    # Create a dictionary with ALL features initialized to 0
-    features = {feat: 0 for feat in expected_features}
+    name_to_idx = {name: i for i, name in enumerate(feature_names)}
+    numeric_idx = [name_to_idx.get(name) for name in NUMERIC_FEATURES]
+    
+    first = numeric_idx[0]
+    if first is not None and numeric_idx == list(range(first, first + len(numeric_idx))):
+        numeric_cols, numeric_pos = slice(first, first + len(numeric_idx)), None
+    else:
+        numeric_pos = tuple(pos for pos, idx in enumerate(numeric_idx) if idx is not None)
+        numeric_cols = np.array([numeric_idx[pos] for pos in numeric_pos], dtype=np.intp)
+    
+    # One-hot columns keyed by the raw value, so lookups need no string building
+    onehot_cols = {'stage': {}, 'sector': {}, 'country': {}}
+    for name, idx in name_to_idx.items():
+        prefix, _, value = name.partition('_')
+        if prefix in onehot_cols:
+            onehot_cols[prefix][value] = idx
+    
+    index = (feature_names, numeric_cols, numeric_pos,
+             onehot_cols['stage'], onehot_cols['sector'], onehot_cols['country'])
+    model._vs_feature_index = index
+    return index
+
+
+def prepare_features(
+    funding_amount: float,
+    stage: str,
+    sector: str,
+    country: str,
+    investors_count: int,
+    founded_year: int,
+    kpis: KPIs,
+    model
+) -> np.ndarray:
+    """
+    Prepare features in the format expected by the trained model.
+    
+    Fills a (1, n_features) float32 row with ALL columns the model expects
+    (113 total), in the model's column order. sector and country must
+    already be normalized (lowercase / uppercase), as get_user_input and
+    predict_startup do. The row buffer is allocated
+    once per model and overwritten by the next call, so copy it if you
+    need to keep it.
+    """
+    (feature_names, numeric_cols, numeric_pos,
+     stage_cols, sector_cols, country_cols) = _feature_index(model)
+    
+    # Reuse the model's row buffer; all features start at 0
+    buffer = getattr(model, '_vs_row', None)
+    if buffer is None:
+        buffer = np.zeros((1, len(feature_names)), dtype=np.float32)
+        model._vs_row = buffer
+    else:
+        buffer.fill(0.0)
+    row = buffer[0]
+    
+    # Fill in the numeric features (NUMERIC_FEATURES order)
+    numeric_values = (
+        funding_amount,
+        investors_count,
+        kpis.rule_of_40,
+        kpis.traction_index,
+        kpis.capital_efficiency,
+        kpis.burn_multiple,
+        kpis.runway_months,
+        kpis.investment_score
+    )
+    if numeric_pos is not None:
+        numeric_values = [numeric_values[pos] for pos in numeric_pos]
+    row[numeric_cols] = numeric_values
     
-    # Fill in the numeric features
-    features['funding_amount'] = funding_amount
-    features['investors_count'] = investors_count
-    features['rule_of_40'] = kpis['rule_of_40']
-    features['traction_index'] = kpis['traction_index']
-    features['capital_efficiency'] = kpis['capital_efficiency']
-    features['burn_multiple'] = kpis['burn_multiple']
-    features['runway_months'] = kpis['runway_months']
-    features['investment_score'] = kpis['investment_score']
+    # Fill in stage / sector / country (one-hot encoding)
+    for idx in (stage_cols.get(stage), sector_cols.get(sector), country_cols.get(country)):
+        if idx is not None:
+            row[idx] = 1
     
-    # Fill in stage (one-hot encoding)
-    stage_col = f'stage_{stage}'
-    if stage_col in features:
-        features[stage_col] = 1
+    return buffer
+
+
+# ==================== MODEL LOADING ====================
+
+class OnnxModel:
+    """
+    ONNX Runtime wrapper exposing the fitted model's predict_proba interface.
     
-    # Fill in sector (one-hot encoding)
-    sector_lower = sector.lower()
-    sector_col = f'sector_{sector_lower}'
-    if sector_col in features:
-        features[sector_col] = 1
+    The original sklearn estimator stays available as ``.model``.
+    """
     
-    # Fill in country (one-hot encoding)
-    country_upper = country.upper()
-    country_col = f'country_{country_upper}'
-    if country_col in features:
-        features[country_col] = 1
+    def __init__(self, session, model):
+        self.session = session
+        self.model = model
+        self.input_name = session.get_inputs()[0].name
+        self.output_names = [session.get_outputs()[1].name]
+        self.classes_ = model.classes_
+        self.n_features_in_ = model.n_features_in_
+        if hasattr(model, 'feature_names_in_'):
+            self.feature_names_in_ = model.feature_names_in_
+    
+    def predict_proba(self, X) -> np.ndarray:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        return self.session.run(self.output_names, {self.input_name: X})[0]
+
+
+def _load_onnx(model, pkl_path: Path) -> Optional[OnnxModel]:
+    """
+    Compile a fitted model to ONNX and open it with ONNX Runtime.
+    
+    The converted graph is cached as a .onnx file next to the pickle and
+    rebuilt whenever the pickle is newer.
+    
+    Returns:
+        OnnxModel, or None if onnxruntime isn't installed or the model
+        can't be converted or loaded
+    """
+    # Imported on first model load: both are optional and slow to import
+    try:
+        import onnxruntime
+    except ImportError:  # onnxruntime is optional; predict with the sklearn model
+        return None
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+    except ImportError:  # skl2onnx is only needed to create the .onnx file
+        convert_sklearn = None
     
-    # Convert to DataFrame with columns in the EXACT order expected by model
-    df = pd.DataFrame([features], columns=expected_features)
+    onnx_path = pkl_path.with_suffix('.onnx')
+    try:
+        if onnx_path.exists() and onnx_path.stat().st_mtime_ns >= pkl_path.stat().st_mtime_ns:
+            onnx_bytes = onnx_path.read_bytes()
+        elif convert_sklearn is not None:
+            onx = convert_sklearn(
+                model,
+                initial_types=[('input', FloatTensorType([None, model.n_features_in_]))],
+                options={id(model): {'zipmap': False}},
+            )
+            onnx_bytes = onx.SerializeToString()
+            try:
+                onnx_path.write_bytes(onnx_bytes)
+            except OSError:
+                pass  # read-only results dir: keep the in-memory graph only
+        else:
+            return None
+        
+        session = onnxruntime.InferenceSession(onnx_bytes, providers=['CPUExecutionProvider'])
+        return OnnxModel(session, model)
     
-    return df
+    except Exception as e:
+        print(f"⚠️  ONNX conversion failed, using sklearn model: {e}")
+        return None
 
 
-# ==================== MODEL LOADING ====================
+@lru_cache(maxsize=1)
+def _load_model_cached(path: str, mtime_ns: int):
+    """
+    Unpickle a model (ONNX-compiled when possible); cached per (resolved
+    path, file mtime). Only the latest model is kept, so a replaced file
+    doesn't leave its old forest in memory.
+    """
+    # Plain pickle rather than joblib.load(mmap_mode='r'): sklearn trees copy
+    # their node arrays out of any memmap on unpickling, so nothing would be
+    # shared between processes, and the mmap load is much slower
+    with open(path, 'rb') as f:
+        model = pickle.load(f)
+    
+    # A new or changed model file: drop predictions memoized for the old
+    # model so the cache doesn't keep it alive
+    _predict_cached.cache_clear()
+    
+    return _load_onnx(model, Path(path)) or model
+
 
 def load_model(model_path: str = "results/models/random_forest.pkl") -> Optional[object]:
-    """Load the trained Random Forest model."""
+    """
+    Load the trained Random Forest model.
+    
+    The unpickled model is cached in-process, so repeated calls only re-read
+    the file after it changes on disk. If onnxruntime is installed, the model
+    is served through ONNX Runtime (see OnnxModel).
+    """
     try:
         model_file = Path(model_path)
         if not model_file.exists():
@@ -248,8 +553,7 @@ def load_model(model_path: str = "results/models/random_forest.pkl") -> Optional
             print(f"   Please run: python src/venture_scope/ml/model.py")
             return None
         
-        with open(model_file, 'rb') as f:
-            model = pickle.load(f)
+        model = _load_model_cached(str(model_file.resolve()), model_file.stat().st_mtime_ns)
         
         print(f"✅ Model loaded successfully from {model_path}")
         return model
@@ -261,36 +565,96 @@ def load_model(model_path: str = "results/models/random_forest.pkl") -> Optional
 
 # ==================== PREDICTION ====================
 
+def _model_input(model, features: np.ndarray):
+    """Wrap a feature matrix in a DataFrame for sklearn models fitted on one."""
+    if (isinstance(features, np.ndarray) and hasattr(model, 'feature_names_in_')
+            and not isinstance(model, OnnxModel)):
+        # Keep sklearn's feature-name check for models fitted on a DataFrame.
+        # pandas is imported here only: KPI, interpretation and ONNX use of
+        # this module never needs it, and it is the slowest import
+        import pandas as pd
+        return pd.DataFrame(features, columns=model.feature_names_in_, copy=False)
+    return features
+
+
+def _confidence_level(success_prob: float) -> str:
+    """Confidence level based on how far the probability is from 0.5."""
+    if success_prob > 0.8 or success_prob < 0.2:
+        return "HIGH"
+    elif success_prob > 0.65 or success_prob < 0.35:
+        return "MEDIUM"
+    else:
+        return "LOW"
+
+
 def predict_success(
     model,
-    features: pd.DataFrame
+    features: np.ndarray
 ) -> Tuple[float, str]:
     """
     Predict success probability for a startup.
     
+    Args:
+        model: Trained model (sklearn estimator or OnnxModel)
+        features: Feature row(s) from prepare_features. These are float32,
+            the dtype sklearn trees and ONNX Runtime evaluate in, so no
+            conversion copy is made before traversal.
+    
     Returns:
         (probability, confidence_level)
     """
-    # Get prediction probability
-    prob = model.predict_proba(features)[0]
-    success_prob = prob[1]  # Probability of success (class 1)
-    
-    # Determine confidence level based on probability
-    if success_prob > 0.8 or success_prob < 0.2:
-        confidence = "HIGH"
-    elif success_prob > 0.65 or success_prob < 0.35:
-        confidence = "MEDIUM"
+    # Imported here: sklearn is loaded anyway once a model is unpickled
+    from sklearn.ensemble._forest import ForestClassifier
+
+    # Get prediction probability (of success, class 1)
+    if len(features) == 1 and isinstance(model, ForestClassifier):
+        # One row: average the trees directly on a float32 array, skipping
+        # the forest's joblib dispatch and per-call input validation. Only
+        # forests predict the plain mean of their trees (boosting and other
+        # ensembles go through predict_proba)
+        estimators = model.estimators_
+        X = np.ascontiguousarray(features, dtype=np.float32)
+        success_prob = sum(
+            tree.predict_proba(X, check_input=False)[0, 1] for tree in estimators
+        ) / len(estimators)
     else:
-        confidence = "LOW"
+        success_prob = model.predict_proba(_model_input(model, features))[0][1]
     
-    return success_prob, confidence
+    # Python float: thresholds and display then use plain float math, also
+    # for ONNX's float32 output, matching predict_startup_batch
+    success_prob = float(success_prob)
+    return success_prob, _confidence_level(success_prob)
 
 
 # ==================== INTERPRETATION ====================
 
+# Funding bar per stage: stage -> (threshold $, label)
+_FUNDING_RULES = {
+    'Seed': (2_000_000, "Strong seed funding"),
+    'Series A': (8_000_000, "Strong Series A"),
+    'Series B': (20_000_000, "Strong Series B"),
+}
+_FUNDING_BAR = np.array([_FUNDING_RULES.get(s, (np.inf,))[0] for s in STAGES], dtype=np.float64)
+
+# KPI rules: (kpi, sign, strength above, strength message, concern below, concern message).
+# sign=-1 flips the comparisons for KPIs where lower is better.
+_KPI_RULES = (
+    ('capital_efficiency', 1, 0.40, "Strong capital efficiency ({:.2f})",
+     0.20, "Low capital efficiency ({:.2f})"),
+    ('burn_multiple', -1, 1.5, "Efficient burn rate (${:.1f} burned per $1 revenue)",
+     3.0, "High burn rate (${:.1f} burned per $1 revenue)"),
+    ('runway_months', 1, 15, "Healthy runway ({:.0f} months)",
+     9, "Limited runway ({:.0f} months)"),
+    ('traction_index', 1, 60, "Strong traction index ({:.0f}/100)",
+     30, "Low traction index ({:.0f}/100)"),
+    ('investment_score', 1, 70, "High investment score ({:.0f}/100)",
+     40, "Below-average investment score ({:.0f}/100)"),
+)
+
+
 def interpret_prediction(
     success_prob: float,
-    kpis: Dict[str, float],
+    kpis: KPIs,
     funding_amount: float,
     stage: str,
     investors_count: int
@@ -305,12 +669,9 @@ def interpret_prediction(
     concerns = []
     
     # Funding
-    if stage == 'Seed' and funding_amount > 2_000_000:
-        strengths.append(f"Strong seed funding (${funding_amount/1e6:.1f}M)")
-    elif stage == 'Series A' and funding_amount > 8_000_000:
-        strengths.append(f"Strong Series A (${funding_amount/1e6:.1f}M)")
-    elif stage == 'Series B' and funding_amount > 20_000_000:
-        strengths.append(f"Strong Series B (${funding_amount/1e6:.1f}M)")
+    funding_rule = _FUNDING_RULES.get(stage)
+    if funding_rule is not None and funding_amount > funding_rule[0]:
+        strengths.append(f"{funding_rule[1]} (${funding_amount/1e6:.1f}M)")
     
     # Investors
     if investors_count >= 5:
@@ -318,39 +679,69 @@ def interpret_prediction(
     elif investors_count <= 2:
         concerns.append(f"Limited investor validation ({investors_count} investors)")
     
-    # Capital Efficiency
-    if kpis['capital_efficiency'] > 0.40:
-        strengths.append(f"Strong capital efficiency ({kpis['capital_efficiency']:.2f})")
-    elif kpis['capital_efficiency'] < 0.20:
-        concerns.append(f"Low capital efficiency ({kpis['capital_efficiency']:.2f})")
-    
-    # Burn Multiple
-    if kpis['burn_multiple'] < 1.5:
-        strengths.append(f"Efficient burn rate (${kpis['burn_multiple']:.1f} burned per $1 revenue)")
-    elif kpis['burn_multiple'] > 3.0:
-        concerns.append(f"High burn rate (${kpis['burn_multiple']:.1f} burned per $1 revenue)")
-    
-    # Runway
-    if kpis['runway_months'] > 15:
-        strengths.append(f"Healthy runway ({kpis['runway_months']:.0f} months)")
-    elif kpis['runway_months'] < 9:
-        concerns.append(f"Limited runway ({kpis['runway_months']:.0f} months)")
-    
-    # Traction
-    if kpis['traction_index'] > 60:
-        strengths.append(f"Strong traction index ({kpis['traction_index']:.0f}/100)")
-    elif kpis['traction_index'] < 30:
-        concerns.append(f"Low traction index ({kpis['traction_index']:.0f}/100)")
-    
-    # Investment Score
-    if kpis['investment_score'] > 70:
-        strengths.append(f"High investment score ({kpis['investment_score']:.0f}/100)")
-    elif kpis['investment_score'] < 40:
-        concerns.append(f"Below-average investment score ({kpis['investment_score']:.0f}/100)")
+    # KPIs
+    for key, sign, high, strength, low, concern in _KPI_RULES:
+        value = getattr(kpis, key)
+        if sign * value > sign * high:
+            strengths.append(strength.format(value))
+        elif sign * value < sign * low:
+            concerns.append(concern.format(value))
     
     return {'strengths': strengths, 'concerns': concerns}
 
 
+def interpret_prediction_batch(
+    kpis: Dict[str, np.ndarray],
+    funding: np.ndarray,
+    stage_idx: np.ndarray,
+    investors: np.ndarray
+) -> list:
+    """
+    Vectorized interpret_prediction for many startups at once.
+    
+    Each rule is evaluated as one mask over all rows; only matching rows
+    format a message.
+    
+    Args:
+        kpis: KPI name -> array, as returned by calculate_kpis_batch
+        funding: Total funding raised ($) per startup
+        stage_idx: Position of each startup's stage in STAGES, -1 for an
+            unknown stage (no funding bar, as in interpret_prediction)
+        investors: Number of unique investors
+    
+    Returns:
+        List of {'strengths': [...], 'concerns': [...]} dicts, one per row
+    """
+    funding = np.asarray(funding, dtype=np.float64)
+    stage_idx = np.asarray(stage_idx, dtype=np.intp)
+    investors = np.asarray(investors)
+    strengths = [[] for _ in range(len(funding))]
+    concerns = [[] for _ in range(len(funding))]
+    
+    # Funding
+    funding_bar = np.where(stage_idx >= 0, _FUNDING_BAR[stage_idx], np.inf)
+    for i in np.flatnonzero(funding > funding_bar):
+        label = _FUNDING_RULES[STAGES[stage_idx[i]]][1]
+        strengths[i].append(f"{label} (${funding[i]/1e6:.1f}M)")
+    
+    # Investors
+    investors_list = investors.tolist()
+    for i in np.flatnonzero(investors >= 5):
+        strengths[i].append(f"Good investor validation ({investors_list[i]} investors)")
+    for i in np.flatnonzero(investors <= 2):
+        concerns[i].append(f"Limited investor validation ({investors_list[i]} investors)")
+    
+    # KPIs
+    for key, sign, high, strength, low, concern in _KPI_RULES:
+        values = np.asarray(kpis[key])
+        for i in np.flatnonzero(sign * values > sign * high):
+            strengths[i].append(strength.format(values[i]))
+        for i in np.flatnonzero(sign * values < sign * low):
+            concerns[i].append(concern.format(values[i]))
+    
+    return [{'strengths': st, 'concerns': co} for st, co in zip(strengths, concerns)]
+
+
 def get_recommendation(success_prob: float) -> str:
     """Get investment recommendation based on probability."""
     if success_prob >= 0.75:
@@ -365,6 +756,11 @@ def get_recommendation(success_prob: float) -> str:
 
 # ==================== USER INTERACTION ====================
 
+# Numeric input formats, checked up front instead of catching ValueError
+_FLOAT_RE = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?')
+_INT_RE = re.compile(r'[+-]?\d+')
+
+
 def get_user_input() -> Dict:
     """Interactively collect startup information from user."""
     print("\n📋 Enter startup information:")
@@ -372,21 +768,21 @@ def get_user_input() -> Dict:
     
     # Funding amount
     while True:
-        try:
-            funding_str = input("  Funding raised (e.g., 10000000 for $10M): $")
-            funding_amount = float(funding_str)
-            if funding_amount <= 0:
-                print("     ⚠️  Funding must be positive")
-                continue
-            break
-        except ValueError:
+        funding_str = input("  Funding raised (e.g., 10000000 for $10M): $").strip()
+        if not _FLOAT_RE.fullmatch(funding_str):
             print("     ⚠️  Please enter a valid number")
+            continue
+        funding_amount = float(funding_str)
+        if funding_amount <= 0:
+            print("     ⚠️  Funding must be positive")
+            continue
+        break
     
     # Stage
     print(f"\n  Available stages: {', '.join(STAGES)}")
     while True:
         stage = input("  Stage: ").strip()
-        if stage in STAGES:
+        if stage in _STAGES_SET:
             break
         print(f"     ⚠️  Please choose from: {', '.join(STAGES)}")
     
@@ -404,25 +800,27 @@ def get_user_input() -> Dict:
     
     # Investors
     while True:
-        try:
-            investors_count = int(input("  Number of investors: "))
-            if investors_count < 0:
-                print("     ⚠️  Cannot be negative")
-                continue
-            break
-        except ValueError:
+        investors_str = input("  Number of investors: ").strip()
+        if not _INT_RE.fullmatch(investors_str):
             print("     ⚠️  Please enter a valid number")
+            continue
+        investors_count = int(investors_str)
+        if investors_count < 0:
+            print("     ⚠️  Cannot be negative")
+            continue
+        break
     
     # Founded year
     while True:
-        try:
-            founded_year = int(input("  Founded year (e.g., 2020): "))
-            if founded_year < 1990 or founded_year > 2025:
-                print("     ⚠️  Please enter a realistic year (1990-2025)")
-                continue
-            break
-        except ValueError:
+        year_str = input("  Founded year (e.g., 2020): ").strip()
+        if not _INT_RE.fullmatch(year_str):
             print("     ⚠️  Please enter a valid year")
+            continue
+        founded_year = int(year_str)
+        if founded_year < 1990 or founded_year > 2025:
+            print("     ⚠️  Please enter a realistic year (1990-2025)")
+            continue
+        break
     
     return {
         'funding_amount': funding_amount,
@@ -434,11 +832,86 @@ def get_user_input() -> Dict:
     }
 
 
+def read_csv_inputs(lines) -> List[Dict]:
+    """
+    Parse startups from CSV lines (e.g. piped stdin), one per row.
+    
+    Columns: funding_amount, stage, sector, country, investors_count,
+    founded_year. Only funding_amount is required; empty or missing fields
+    take predict_startup's defaults. A header row is skipped. Rows that fail
+    get_user_input's checks (positive funding, known stage, non-negative
+    investors, founded 1990-2025) are reported and skipped.
+    
+    Returns:
+        List of predict_startup keyword dicts
+    """
+    rows = []
+    for line_no, fields in enumerate(csv.reader(lines), start=1):
+        fields = [field.strip() for field in fields]
+        if not any(fields):
+            continue
+        fields += [''] * (6 - len(fields))
+        funding_str, stage, sector, country, investors_str, year_str = fields[:6]
+        
+        if not _FLOAT_RE.fullmatch(funding_str):
+            if line_no > 1:
+                print(f"⚠️  Line {line_no}: invalid funding amount '{funding_str}', skipped")
+            continue
+        if not all(_INT_RE.fullmatch(value) for value in (investors_str, year_str) if value):
+            print(f"⚠️  Line {line_no}: invalid investors count or founded year, skipped")
+            continue
+        
+        funding_amount = float(funding_str)
+        investors_count = int(investors_str) if investors_str else None
+        founded_year = int(year_str) if year_str else None
+        
+        # Same range checks as the interactive prompts
+        if funding_amount <= 0:
+            problem = "funding must be positive"
+        elif stage and stage not in _STAGES_SET:
+            problem = f"unknown stage '{stage}'"
+        elif investors_count is not None and investors_count < 0:
+            problem = "investors count cannot be negative"
+        elif founded_year is not None and not 1990 <= founded_year <= 2025:
+            problem = "founded year must be 1990-2025"
+        else:
+            problem = None
+        if problem:
+            print(f"⚠️  Line {line_no}: {problem}, skipped")
+            continue
+        
+        rows.append({
+            'funding_amount': funding_amount,
+            'stage': stage or None,
+            'sector': sector or None,
+            'country': country or None,
+            'investors_count': investors_count,
+            'founded_year': founded_year
+        })
+    
+    return rows
+
+
 # ==================== DISPLAY RESULTS ====================
 
+def display_batch_results(results: List[Dict]):
+    """Display one summary line per startup from predict_startup_batch."""
+    lines = ["\n" + "=" * 70, "📊 BATCH PREDICTIONS", "=" * 70]
+    for i, result in enumerate(results, start=1):
+        inputs = result['inputs']
+        success_prob = result['success_probability']
+        lines.append(
+            f"  {i:>3}. ${inputs['funding_amount']/1e6:,.1f}M {inputs['stage']}, "
+            f"{inputs['sector']}, {inputs['country']}: {success_prob*100:.1f}% "
+            f"({result['confidence']}) {get_recommendation(success_prob)}"
+        )
+    lines.append("=" * 70)
+    print("\n".join(lines))
+
+
 def display_results(
     inputs: Dict,
-    kpis: Dict,
+    kpis: KPIs,
     success_prob: float,
     confidence: str,
     interpretation: Dict
@@ -448,14 +921,14 @@ def display_results(
     print("\n" + "=" * 70)
     print("📊 CALCULATED KPIs")
     print("=" * 70)
-    print(f"  Estimated Revenue:     ${kpis['estimated_revenue']:,.0f}/year")
-    print(f"  Capital Efficiency:    {kpis['capital_efficiency']:.2f} ({kpis['capital_efficiency']*100:.0f}%)")
-    print(f"  Monthly Burn:          ${kpis['monthly_burn']:,.0f}/month")
-    print(f"  Runway:                {kpis['runway_months']:.0f} months")
-    print(f"  Burn Multiple:         {kpis['burn_multiple']:.2f}x")
-    print(f"  Traction Index:        {kpis['traction_index']:.0f}/100")
-    print(f"  Rule of 40:            {kpis['rule_of_40']:.0f}")
-    print(f"  Investment Score:      {kpis['investment_score']:.0f}/100")
+    print(f"  Estimated Revenue:     ${kpis.estimated_revenue:,.0f}/year")
+    print(f"  Capital Efficiency:    {kpis.capital_efficiency:.2f} ({kpis.capital_efficiency*100:.0f}%)")
+    print(f"  Monthly Burn:          ${kpis.monthly_burn:,.0f}/month")
+    print(f"  Runway:                {kpis.runway_months:.0f} months")
+    print(f"  Burn Multiple:         {kpis.burn_multiple:.2f}x")
+    print(f"  Traction Index:        {kpis.traction_index:.0f}/100")
+    print(f"  Rule of 40:            {kpis.rule_of_40:.0f}")
+    print(f"  Investment Score:      {kpis.investment_score:.0f}/100")
     
     print("\n" + "=" * 70)
     print("🔮 PREDICTION")
@@ -521,24 +994,97 @@ def display_results(
 
 # ==================== MAIN FUNCTION ====================
 
+@lru_cache(maxsize=512)
+def _predict_cached(
+    model,
+    funding_amount: float,
+    stage: str,
+    sector: str,
+    country: str,
+    investors_count: int,
+    founded_year: int
+) -> Tuple[KPIs, float, str, Dict[str, list]]:
+    """
+    KPIs, prediction and interpretation for one startup.
+    
+    Memoized per (model, inputs): repeated queries skip KPI calculation,
+    feature preparation and the model call. Failures raise, so they are
+    never cached. Cleared whenever load_model reads a new model file.
+    
+    Returns:
+        (kpis, success_prob, confidence, interpretation)
+    """
+    kpis = calculate_kpis(
+        funding_amount=funding_amount,
+        stage=stage,
+        investors_count=investors_count,
+        founded_year=founded_year
+    )
+    
+    features = prepare_features(
+        funding_amount=funding_amount,
+        stage=stage,
+        sector=sector,
+        country=country,
+        investors_count=investors_count,
+        founded_year=founded_year,
+        kpis=kpis,
+        model=model
+    )
+    
+    success_prob, confidence = predict_success(model, features)
+    
+    interpretation = interpret_prediction(
+        success_prob=success_prob,
+        kpis=kpis,
+        funding_amount=funding_amount,
+        stage=stage,
+        investors_count=investors_count
+    )
+    
+    return kpis, success_prob, confidence, interpretation
+
+
+def _startup_inputs(
+    funding_amount: float,
+    stage: Optional[str] = None,
+    sector: Optional[str] = None,
+    country: Optional[str] = None,
+    investors_count: Optional[int] = None,
+    founded_year: Optional[int] = None
+) -> Dict:
+    """Programmatic inputs with defaults filled in and sector/country normalized."""
+    return {
+        'funding_amount': funding_amount,
+        'stage': stage or 'Series A',
+        'sector': (sector or 'saas').lower(),
+        'country': (country or 'USA').upper(),
+        'investors_count': investors_count or 3,
+        'founded_year': founded_year or 2020
+    }
+
+
 def predict_startup(
     funding_amount: Optional[float] = None,
     stage: Optional[str] = None,
     sector: Optional[str] = None,
     country: Optional[str] = None,
     investors_count: Optional[int] = None,
-    founded_year: Optional[int] = None
+    founded_year: Optional[int] = None,
+    model=None
 ) -> Optional[Dict]:
     """
     Predict startup success probability.
     
     Can be called interactively (no args) or programmatically (with args).
+    Pass an already loaded model to skip load_model().
     
     Returns:
         Dictionary with prediction results or None if error
     """
     # Load model
-    model = load_model()
+    if model is None:
+        model = load_model()
     if model is None:
         return None
     
@@ -546,60 +1092,35 @@ def predict_startup(
     if funding_amount is None:
         inputs = get_user_input()
     else:
-        inputs = {
-            'funding_amount': funding_amount,
-            'stage': stage or 'Series A',
-            'sector': sector or 'saas',
-            'country': country or 'USA',
-            'investors_count': investors_count or 3,
-            'founded_year': founded_year or 2020
-        }
+        inputs = _startup_inputs(
+            funding_amount, stage, sector, country, investors_count, founded_year
+        )
     
     print("\n⏳ Calculating KPIs...")
     
-    # Calculate KPIs
-    kpis = calculate_kpis(
-        funding_amount=inputs['funding_amount'],
-        stage=inputs['stage'],
-        investors_count=inputs['investors_count'],
-        founded_year=inputs['founded_year']
-    )
-    
-    print("✅ KPIs calculated")
-    print("⏳ Preparing features...")
-    
-    # Prepare features for model
-    features = prepare_features(
-        funding_amount=inputs['funding_amount'],
-        stage=inputs['stage'],
-        sector=inputs['sector'],
-        country=inputs['country'],
-        investors_count=inputs['investors_count'],
-        founded_year=inputs['founded_year'],
-        kpis=kpis,
-        model=model
-    )
-    
-    print("✅ Features prepared")
-    print("⏳ Running prediction...")
-    
-    # Predict
+    # Identical inputs reuse the memoized KPIs, prediction and interpretation
     try:
-        success_prob, confidence = predict_success(model, features)
+        kpis, success_prob, confidence, interpretation = _predict_cached(
+            model,
+            inputs['funding_amount'],
+            inputs['stage'],
+            inputs['sector'],
+            inputs['country'],
+            inputs['investors_count'],
+            inputs['founded_year']
+        )
     except Exception as e:
         print(f"❌ Prediction failed: {e}")
         return None
     
+    print("✅ KPIs calculated")
+    print("⏳ Preparing features...")
+    print("✅ Features prepared")
+    print("⏳ Running prediction...")
     print("✅ Prediction complete")
     
-    # Interpret
-    interpretation = interpret_prediction(
-        success_prob=success_prob,
-        kpis=kpis,
-        funding_amount=inputs['funding_amount'],
-        stage=inputs['stage'],
-        investors_count=inputs['investors_count']
-    )
+    # Fresh copies so callers can't mutate the cached entry
+    interpretation = {key: list(items) for key, items in interpretation.items()}
     
     # Display results
     display_results(inputs, kpis, success_prob, confidence, interpretation)
@@ -607,32 +1128,125 @@ def predict_startup(
     # Return results for programmatic use
     return {
         'inputs': inputs,
-        'kpis': kpis,
+        'kpis': kpis.as_dict(),
         'success_probability': success_prob,
         'confidence': confidence,
         'interpretation': interpretation
     }
 
 
+def predict_startup_batch(rows: List[Dict], model=None) -> Optional[List[Dict]]:
+    """
+    Predict success probability for many startups with one model call.
+    
+    Args:
+        rows: One dict per startup with predict_startup's keyword arguments
+            (funding_amount is required, the rest default as there)
+        model: Already loaded model; load_model() is used if None
+    
+    Returns:
+        List of result dictionaries in predict_startup's format (without
+        printing them), or None if error
+    """
+    if model is None:
+        model = load_model()
+    if model is None:
+        return None
+    
+    all_inputs = [_startup_inputs(**row) for row in rows]
+    if not all_inputs:
+        return []
+    
+    try:
+        (feature_names, numeric_cols, numeric_pos,
+         stage_cols, sector_cols, country_cols) = _feature_index(model)
+    except ValueError as e:
+        print(f"❌ Prediction failed: {e}")
+        return None
+    
+    # Inputs as columns; unknown stages -> -1 (Series A KPI defaults)
+    funding = np.array([inputs['funding_amount'] for inputs in all_inputs], dtype=np.float64)
+    stage_idx = np.array(
+        [_STAGE_INDEX.get(inputs['stage'], -1) for inputs in all_inputs], dtype=np.intp
+    )
+    investors = np.array([inputs['investors_count'] for inputs in all_inputs])
+    founded_year = np.array([inputs['founded_year'] for inputs in all_inputs])
+    
+    kpis = calculate_kpis_batch(funding, stage_idx, investors, founded_year)
+    
+    # Feature matrix: numeric block (NUMERIC_FEATURES order), then one-hots
+    X = np.zeros((len(all_inputs), len(feature_names)), dtype=np.float32)
+    numeric = np.column_stack([
+        funding, investors, kpis['rule_of_40'], kpis['traction_index'],
+        kpis['capital_efficiency'], kpis['burn_multiple'],
+        kpis['runway_months'], kpis['investment_score']
+    ])
+    if numeric_pos is not None:
+        numeric = numeric[:, list(numeric_pos)]
+    X[:, numeric_cols] = numeric
+    
+    rows_idx = np.arange(len(all_inputs))
+    for key, cols in (('stage', stage_cols), ('sector', sector_cols), ('country', country_cols)):
+        col_idx = np.array([cols.get(inputs[key], -1) for inputs in all_inputs], dtype=np.intp)
+        known = col_idx >= 0
+        X[rows_idx[known], col_idx[known]] = 1
+    
+    try:
+        probabilities = model.predict_proba(_model_input(model, X))[:, 1].tolist()
+    except Exception as e:
+        print(f"❌ Prediction failed: {e}")
+        return None
+    
+    interpretations = interpret_prediction_batch(kpis, funding, stage_idx, investors)
+    
+    # Back to one dict of Python scalars per startup
+    kpi_rows = [dict(zip(kpis, values)) for values in zip(*(v.tolist() for v in kpis.values()))]
+    
+    results = []
+    for inputs, kpi_row, success_prob, interpretation in zip(
+        all_inputs, kpi_rows, probabilities, interpretations
+    ):
+        results.append({
+            'inputs': inputs,
+            'kpis': kpi_row,
+            'success_probability': success_prob,
+            'confidence': _confidence_level(success_prob),
+            'interpretation': interpretation
+        })
+    
+    return results
+
+
 # ==================== CLI ENTRY POINT ====================
 
 def main():
     """Command-line interface entry point."""
+    print("🚀 VENTURE-SCOPE: Startup Success Predictor")
+    print("=" * 70)
     print("\nWelcome to the VENTURE-SCOPE Startup Success Predictor!")
     print("\nThis tool predicts startup success probability based on")
     print("machine learning trained on historical VC-backed companies.\n")
     
-    while True:
-        result = predict_startup()
-        
-        if result is None:
-            break
-        
-        print("\n" + "=" * 70)
-        again = input("\n🔄 Predict another startup? (y/n): ").strip().lower()
-        if again != 'y':
-            break
-        print("\n" + "=" * 70 + "\n")
+    # Load once; every prediction in the session reuses it
+    model = load_model()
+    
+    if not sys.stdin.isatty():
+        # Piped input: score every CSV row with a single model call
+        results = predict_startup_batch(read_csv_inputs(sys.stdin), model=model)
+        if results:
+            display_batch_results(results)
+    else:
+        while True:
+            result = predict_startup(model=model)
+            
+            if result is None:
+                break
+            
+            print("\n" + "=" * 70)
+            again = input("\n🔄 Predict another startup? (y/n): ").strip().lower()
+            if again != 'y':
+                break
+            print("\n" + "=" * 70 + "\n")
     
     print("\n👋 Thank you for using VENTURE-SCOPE!")
     print("=" * 70 + "\n")
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the VENTURE-SCOPE tests.
+
+The modules are standalone scripts, so they are loaded from their files
+(the way `python <script>` runs them) rather than through the package.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src" / "venture_scope"
+
+# loaders*.py import log_setup as a sibling when not run as a package
+sys.path.insert(0, str(SRC / "ingest"))
+
+
+def load_module(name, relative_path):
+    """Import a module from src/venture_scope by file path (once per session)."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, SRC / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def predict():
+    return load_module("predict_mod", "ml/predict.py")
+
+
+@pytest.fixture(scope="session")
+def scoring():
+    return load_module("scoring_mod", "features/scoring.py")
+
+
+@pytest.fixture(scope="session")
+def kpi():
+    return load_module("kpi_mod", "features/kpi.py")
+
+
+@pytest.fixture(scope="session")
+def loaders():
+    return load_module("loaders_mod", "ingest/loaders.py")
+
+
+@pytest.fixture(scope="session")
+def loaders_enriched():
+    return load_module("loaders_enriched_mod", "ingest/loaders_enriched.py")
+
+
+@pytest.fixture(scope="session")
+def model_comparison():
+    return load_module("model_comparison_mod", "ml/model_comparison.py")
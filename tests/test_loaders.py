@@ -0,0 +1,155 @@
+"""
+Tests for the Crunchbase loaders: the enriched loader's Parquet cache and
+feeding loader output into the KPI calculations.
+"""
+
+import pandas as pd
+import pytest
+
+
+OBJECTS = pd.DataFrame({
+    'id': ['c:1', 'c:2', 'c:3', 'f:1'],
+    'name': ['Alpha', 'Beta', 'Gamma', 'Fund One'],
+    'entity_type': ['Company', 'Company', 'Company', 'FinancialOrg'],
+    'category_code': ['web', 'biotech', 'saas', None],
+    'country_code': ['USA', 'GBR', 'USA', 'USA'],
+    'founded_at': ['2010-03-01', '2015-06-30', None, '2001-01-01'],
+    'funding_total_usd': [5_000_000, 0, 20_000_000, None],
+    'status': ['operating', 'closed', 'acquired', 'operating'],
+})
+ROUNDS = pd.DataFrame({
+    'object_id': ['c:1', 'c:1', 'c:3'],
+    'funding_round_type': ['angel', 'series-a', 'series-b'],
+    'funded_at': ['2011-01-01', '2012-05-01', '2014-02-01'],
+})
+INVESTMENTS = pd.DataFrame({
+    'funded_object_id': ['c:1', 'c:1', 'c:1', 'c:3'],
+    'investor_object_id': ['f:1', 'f:2', 'f:1', 'f:1'],
+})
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    OBJECTS.to_csv(raw / "objects.csv", index=False)
+    ROUNDS.to_csv(raw / "funding_rounds.csv", index=False)
+    INVESTMENTS.to_csv(raw / "investments.csv", index=False)
+    return raw
+
+
+def _fail_merge(*args, **kwargs):
+    raise AssertionError("source CSVs were read despite a valid cache")
+
+
+def _load(loaders_enriched, raw_dir, cache, **kwargs):
+    return loaders_enriched.load_enriched_startups(raw_dir, verbose=False, cache=cache, **kwargs)
+
+
+def test_cache_miss_writes_cache(loaders_enriched, raw_dir, tmp_path):
+    cache = tmp_path / "cache" / "enriched.parquet"
+    df = _load(loaders_enriched, raw_dir, cache)
+
+    assert cache.exists()
+    assert df['company'].tolist() == ['Alpha', 'Gamma']
+    assert df['stage'].tolist() == ['Series A', 'Series B']
+    assert df['investors_count'].tolist() == [2, 1]
+
+
+def test_cache_hit_skips_sources(loaders_enriched, raw_dir, tmp_path, monkeypatch):
+    cache = tmp_path / "enriched.parquet"
+    first = _load(loaders_enriched, raw_dir, cache)
+
+    monkeypatch.setattr(loaders_enriched, "_merge_sources_pandas", _fail_merge)
+    monkeypatch.setattr(loaders_enriched, "_merge_sources_polars", _fail_merge)
+    second = _load(loaders_enriched, raw_dir, cache)
+
+    pd.testing.assert_frame_equal(second, first)
+
+
+def test_cache_invalidated_by_filter_options(loaders_enriched, raw_dir, tmp_path):
+    cache = tmp_path / "enriched.parquet"
+    _load(loaders_enriched, raw_dir, cache)
+
+    df = _load(loaders_enriched, raw_dir, cache, min_funding=10_000_000)
+    assert df['company'].tolist() == ['Gamma']
+
+    df = _load(loaders_enriched, raw_dir, cache, filter_funded=False)
+    assert df['company'].tolist() == ['Alpha', 'Beta', 'Gamma']
+
+
+def test_cache_invalidated_by_changed_source(loaders_enriched, raw_dir, tmp_path):
+    cache = tmp_path / "enriched.parquet"
+    _load(loaders_enriched, raw_dir, cache)
+
+    objects = OBJECTS.copy()
+    objects.loc[1, 'funding_total_usd'] = 750_000
+    objects.to_csv(raw_dir / "objects.csv", index=False)
+
+    df = _load(loaders_enriched, raw_dir, cache)
+    assert df['company'].tolist() == ['Alpha', 'Beta', 'Gamma']
+
+
+def test_corrupt_cache_key_is_a_miss(loaders_enriched, raw_dir, tmp_path):
+    cache = tmp_path / "enriched.parquet"
+    first = _load(loaders_enriched, raw_dir, cache)
+    cache.with_suffix(".cache_key.json").write_text("{not json")
+
+    pd.testing.assert_frame_equal(_load(loaders_enriched, raw_dir, cache), first)
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_missing_labels_stay_missing(loaders_enriched, raw_dir, monkeypatch, chunked):
+    if chunked:
+        monkeypatch.setattr(loaders_enriched, "CHUNKED_READ_BYTES", 0)
+        monkeypatch.setattr(loaders_enriched, "CHUNK_ROWS", 2)
+    objects = OBJECTS.copy()
+    objects.loc[2, ['category_code', 'country_code', 'status']] = None
+    objects.to_csv(raw_dir / "objects.csv", index=False)
+
+    df = loaders_enriched.load_enriched_startups(raw_dir, verbose=False)
+
+    assert df['company'].tolist() == ['Alpha', 'Gamma']
+    for col in ('sector', 'country', 'status'):
+        assert df[col].isna().tolist() == [False, True], col
+        assert 'None' not in df[col].cat.categories
+
+
+KPI_COLUMNS = [
+    'estimated_revenue', 'capital_efficiency', 'monthly_burn', 'runway_months',
+    'burn_multiple', 'traction_index', 'rule_of_40'
+]
+LABEL_COLUMNS = ['stage', 'country', 'sector']
+
+
+def _assert_kpis_match_string_labels(kpi, df):
+    # Loaders return categorical labels; KPIs must equal those of plain strings
+    assert all(isinstance(df[c].dtype, pd.CategoricalDtype) for c in LABEL_COLUMNS)
+    result = kpi.calculate_all_kpis(df, verbose=False)
+    expected = kpi.calculate_all_kpis(df.astype(dict.fromkeys(LABEL_COLUMNS, object)), verbose=False)
+    pd.testing.assert_frame_equal(result[KPI_COLUMNS], expected[KPI_COLUMNS])
+    assert result['rule_of_40'].notna().all()
+
+
+def test_generic_loader_output_feeds_kpis(loaders, kpi, tmp_path):
+    path = tmp_path / "startups.csv"
+    pd.DataFrame({
+        'name': ['Alpha', 'Beta', 'Gamma', 'Fund One'],
+        'entity_type': ['Company', 'Company', 'Company', 'FinancialOrg'],
+        'stage': ['Series A', 'seed', None, None],
+        'category_code': ['web', 'biotech', None, None],
+        'country_code': ['USA', 'GBR', 'USA', None],
+        'funding_total_usd': [5_000_000, 750_000, 20_000_000, None],
+        'investors_count': [3, None, 5, None],
+        'founded_at': ['2010-03-01', None, '2008-05-05', '2001-01-01'],
+    }).to_csv(path, index=False)
+
+    df = loaders.load_startups_csv(path, verbose=False)
+
+    assert df['stage'].tolist()[:2] == ['Series A', 'Seed']
+    _assert_kpis_match_string_labels(kpi, df)
+
+
+def test_enriched_loader_output_feeds_kpis(loaders_enriched, kpi, raw_dir):
+    df = loaders_enriched.load_enriched_startups(raw_dir, verbose=False)
+    _assert_kpis_match_string_labels(kpi, df)
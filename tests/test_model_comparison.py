@@ -0,0 +1,78 @@
+"""
+Tests for the model comparison helpers.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+STATUS = ['acquired', 'operating', None, 'closed', 'ipo']
+
+
+def test_undersample_majority(model_comparison):
+    y = np.array([0] * 90 + [1] * 10)
+    X = np.arange(len(y)).reshape(-1, 1)
+
+    X_res, y_res = model_comparison._undersample_majority(X, y, ratio=0.5)
+
+    assert np.bincount(y_res).tolist() == [20, 10]
+    # Minority rows all kept, row order unchanged, X and y still aligned
+    assert set(X_res[y_res == 1, 0]) == set(range(90, 100))
+    assert np.all(np.diff(X_res[:, 0]) > 0)
+    assert np.array_equal(y_res, y[X_res[:, 0]])
+
+
+def test_undersample_majority_is_reproducible_and_sparse_safe(model_comparison):
+    y = np.array([1, 0] * 5 + [1] * 30)
+    X = sparse.csr_matrix(np.arange(len(y), dtype=float).reshape(-1, 1))
+
+    X_a, y_a = model_comparison._undersample_majority(X, y, ratio=0.5)
+    X_b, y_b = model_comparison._undersample_majority(X, y, ratio=0.5)
+
+    assert np.bincount(y_a).tolist() == [5, 10]
+    assert np.array_equal(X_a.toarray(), X_b.toarray())
+    assert np.array_equal(y_a, y_b)
+
+
+def test_undersample_majority_within_ratio_is_unchanged(model_comparison):
+    y = np.array([0] * 15 + [1] * 10)
+    X = np.arange(len(y)).reshape(-1, 1)
+
+    X_res, y_res = model_comparison._undersample_majority(X, y, ratio=0.5)
+
+    assert X_res is X and y_res is y
+
+
+def test_label_and_clean(model_comparison):
+    num = np.array([[np.nan, 1], [np.nan, 2], [3, np.nan], [4, np.nan], [5, 6]], dtype=np.float32)
+
+    labels, n_nan = model_comparison._label_and_clean(pd.Series(STATUS), num)
+
+    assert labels.tolist() == [1, -1, -1, 0, 1]
+    # Only rows with a known outcome are zero-filled
+    assert n_nan == 2
+    assert np.isnan(num).tolist() == [[False, False], [True, False], [False, True],
+                                      [False, False], [False, False]]
+
+
+def test_real_module_name_works_after_spec_load(model_comparison):
+    # The labelling kernel is JIT-compiled by the module loaded under another
+    # name first; a plain `import model_comparison` must not depend on it
+    num = np.zeros((len(STATUS), 1), dtype=np.float32)
+    expected, _ = model_comparison._label_and_clean(pd.Series(STATUS), num)
+    code = (
+        "import numpy as np, pandas as pd, model_comparison as mc; "
+        f"labels, _ = mc._label_and_clean(pd.Series({STATUS!r}), "
+        f"np.zeros(({len(STATUS)}, 1), dtype=np.float32)); "
+        "print(labels.tolist())"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(model_comparison.__file__).parent,
+        capture_output=True, text=True, check=True
+    )
+    assert out.stdout.splitlines()[-1] == str(expected.tolist())
@@ -0,0 +1,182 @@
+"""
+Tests for the batch and CSV paths of the startup success predictor.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import (
+    AdaBoostClassifier, BaggingClassifier, ExtraTreesClassifier,
+    GradientBoostingClassifier, RandomForestClassifier
+)
+from sklearn.linear_model import LogisticRegression
+
+
+STARTUPS = [
+    {'funding_amount': 10_000_000, 'stage': 'Series A', 'sector': 'saas',
+     'country': 'USA', 'investors_count': 5, 'founded_year': 2018},
+    {'funding_amount': 250_000, 'stage': 'Seed', 'sector': 'FinTech',
+     'country': 'gbr', 'investors_count': 1, 'founded_year': 2024},
+    {'funding_amount': 3_000_000, 'stage': 'Angel', 'investors_count': 2},
+    {'funding_amount': 80_000_000, 'stage': 'Series C', 'sector': 'biotech',
+     'country': 'ISR', 'investors_count': 12, 'founded_year': 2010},
+    {'funding_amount': 500_000_000, 'stage': 'Series D+', 'sector': 'hardware',
+     'country': 'CHN', 'investors_count': 30, 'founded_year': 1995},
+    {'funding_amount': 25_000_000, 'stage': 'Series B', 'sector': 'web',
+     'country': 'DEU', 'investors_count': 4, 'founded_year': 2025},
+    # Unknown stage / sector / country fall back to defaults or no one-hot
+    {'funding_amount': 1_500_000, 'stage': 'Pre-seed', 'sector': 'gaming',
+     'country': 'BRA', 'investors_count': 3, 'founded_year': 2021},
+    {'funding_amount': 50_000},
+]
+
+
+@pytest.fixture(scope="module")
+def training_data(predict):
+    """Random rows with the production feature names."""
+    columns = (
+        list(predict.NUMERIC_FEATURES)
+        + [f'stage_{s}' for s in predict.STAGES]
+        + [f'sector_{s}' for s in predict.COMMON_SECTORS]
+        + [f'country_{c}' for c in predict.COMMON_COUNTRIES]
+    )
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((300, len(columns))), columns=columns)
+    X['funding_amount'] *= 1e8
+    X['investors_count'] = rng.integers(0, 20, len(X))
+    y = (X['investors_count'] + 5 * X['stage_Seed'] > 8).astype(int)
+    return X, y
+
+
+@pytest.fixture(scope="module")
+def model(training_data):
+    """Small forest fitted on the random training rows."""
+    return RandomForestClassifier(n_estimators=10, random_state=0).fit(*training_data)
+
+
+def _stage_idx(predict, stages):
+    return np.array([predict._STAGE_INDEX.get(s, -1) for s in stages], dtype=np.intp)
+
+
+def test_real_module_name_works_after_spec_load(predict):
+    # The JIT core was compiled by the module loaded under another name;
+    # a plain `import predict` must not depend on it
+    expected = predict.calculate_kpis(5e6, 'Series A', 10, 2018)
+    code = "import predict; print(predict.calculate_kpis(5e6, 'Series A', 10, 2018))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(predict.__file__).parent,
+        capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == repr(expected)
+
+
+def test_calculate_kpis_batch_matches_scalar(predict):
+    rng = np.random.default_rng(1)
+    n = 200
+    funding = rng.choice([0.0, 5e4, 1e6, 2.5e7, 3e9], n)
+    stages = rng.choice(predict.STAGES + ['Unknown'], n)
+    investors = rng.integers(0, 40, n)
+    founded = rng.integers(1990, 2027, n)
+
+    batch = predict.calculate_kpis_batch(funding, _stage_idx(predict, stages), investors, founded)
+
+    for i in range(n):
+        expected = predict.calculate_kpis(
+            funding[i], stages[i], int(investors[i]), int(founded[i])
+        ).as_dict()
+        assert set(batch) == set(expected)
+        for key, value in expected.items():
+            assert batch[key][i] == pytest.approx(value, rel=1e-12), (i, key)
+
+
+def test_interpret_prediction_batch_matches_scalar(predict):
+    funding = np.array([row['funding_amount'] for row in STARTUPS], dtype=np.float64)
+    stages = [row.get('stage') for row in STARTUPS]
+    investors = np.array([row.get('investors_count', 0) for row in STARTUPS])
+    founded = np.array([row.get('founded_year', 2020) for row in STARTUPS])
+    stage_idx = _stage_idx(predict, stages)
+
+    kpis = predict.calculate_kpis_batch(funding, stage_idx, investors, founded)
+    batch = predict.interpret_prediction_batch(kpis, funding, stage_idx, investors)
+
+    assert len(batch) == len(STARTUPS)
+    for i, stage in enumerate(stages):
+        scalar_kpis = predict.calculate_kpis(funding[i], stage, int(investors[i]), int(founded[i]))
+        expected = predict.interpret_prediction(
+            0.5, scalar_kpis, funding[i], stage, int(investors[i])
+        )
+        assert batch[i] == expected
+
+
+@pytest.mark.parametrize("estimator", [
+    RandomForestClassifier(n_estimators=10, random_state=0),
+    ExtraTreesClassifier(n_estimators=10, random_state=0),
+    GradientBoostingClassifier(n_estimators=10, random_state=0),
+    AdaBoostClassifier(n_estimators=10, random_state=0),
+    BaggingClassifier(n_estimators=10, random_state=0),
+    LogisticRegression(max_iter=1000),
+], ids=lambda estimator: type(estimator).__name__)
+def test_predict_success_single_row_matches_predict_proba(predict, training_data, estimator):
+    X, y = training_data
+    fitted = estimator.fit(X, y)
+    for i in range(5):
+        row = X.iloc[[i]].to_numpy(dtype=np.float32)
+        success_prob, confidence = predict.predict_success(fitted, row)
+        expected = fitted.predict_proba(pd.DataFrame(row, columns=X.columns))[0, 1]
+        assert success_prob == pytest.approx(expected, rel=1e-12)
+        assert confidence == predict._confidence_level(success_prob)
+
+
+def test_predict_startup_batch_matches_predict_startup(predict, model):
+    results = predict.predict_startup_batch(STARTUPS, model=model)
+
+    assert len(results) == len(STARTUPS)
+    for row, result in zip(STARTUPS, results):
+        expected = predict.predict_startup(**row, model=model)
+        assert result['inputs'] == expected['inputs']
+        assert result['kpis'] == pytest.approx(expected['kpis'], rel=1e-12)
+        assert result['success_probability'] == pytest.approx(expected['success_probability'])
+        assert result['confidence'] == expected['confidence']
+        assert result['interpretation'] == expected['interpretation']
+
+
+def test_predict_startup_batch_empty(predict, model):
+    assert predict.predict_startup_batch([], model=model) == []
+
+
+def test_read_csv_inputs(predict, capsys):
+    lines = [
+        "funding_amount,stage,sector,country,investors_count,founded_year",
+        "10000000,Series A,saas,USA,5,2018",
+        "",
+        " , , ",
+        "2500000",
+        "1e6,Seed,,,,",
+        "abc,Seed,saas,USA,1,2020",
+        "1000000,Seed,saas,USA,two,2020",
+        "-5,Seed,saas,USA,1,2020",
+        "1000000,Series Z,saas,USA,1,2020",
+        "1000000,Seed,saas,USA,-1,2020",
+        "1000000,Seed,saas,USA,1,1980",
+    ]
+
+    rows = predict.read_csv_inputs(lines)
+
+    assert rows == [
+        {'funding_amount': 10_000_000.0, 'stage': 'Series A', 'sector': 'saas',
+         'country': 'USA', 'investors_count': 5, 'founded_year': 2018},
+        {'funding_amount': 2_500_000.0, 'stage': None, 'sector': None,
+         'country': None, 'investors_count': None, 'founded_year': None},
+        {'funding_amount': 1_000_000.0, 'stage': 'Seed', 'sector': None,
+         'country': None, 'investors_count': None, 'founded_year': None},
+    ]
+
+    # The header is skipped silently; every other rejected line is reported
+    warnings = [line for line in capsys.readouterr().out.splitlines() if line.startswith("⚠️")]
+    assert [w.split(":")[0] for w in warnings] == [
+        f"⚠️  Line {n}" for n in (7, 8, 9, 10, 11, 12)
+    ]
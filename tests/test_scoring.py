@@ -0,0 +1,54 @@
+"""
+Tests for the investment score and ranking helpers.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+SCORES = [55.0, 72.5, np.nan, 72.5, 10.0, 55.0, 55.0, 90.0, np.nan, 55.0]
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'company': [f'co{i}' for i in range(len(SCORES))],
+        'investment_score': SCORES,
+    }, index=np.arange(len(SCORES)) * 10)
+
+
+@pytest.mark.parametrize("n", range(len(SCORES) + 2))
+def test_get_top_startups_matches_rank_startups(scoring, df, n):
+    expected = scoring.rank_startups(df).head(n)
+    pd.testing.assert_frame_equal(scoring.get_top_startups(df, n=n), expected)
+
+
+def test_get_top_startups_tie_at_cutoff_keeps_file_order(scoring, df):
+    # Four rows share 55.0; the cutoff at n=5 falls inside that tie
+    top = scoring.get_top_startups(df, n=5)
+    assert top['company'].tolist() == ['co7', 'co1', 'co3', 'co0', 'co5']
+    assert top['rank'].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_real_module_name_works_after_spec_load(scoring):
+    # The score kernel is JIT-compiled by the module loaded under another
+    # name first; a plain `import scoring` must not depend on it
+    kpis = {'rule_of_40': [40.0, 90.0], 'traction_index': [10.0, 60.0],
+            'capital_efficiency': [0.2, 0.9], 'burn_multiple': [3.0, 0.8],
+            'runway_months': [12.0, 30.0]}
+    expected = scoring.calculate_investment_score(pd.DataFrame(kpis), verbose=False)
+    code = (
+        "import pandas as pd, scoring; "
+        f"df = scoring.calculate_investment_score(pd.DataFrame({kpis!r}), verbose=False); "
+        "print(df['investment_score'].tolist())"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(scoring.__file__).parent,
+        capture_output=True, text=True, check=True
+    )
+    assert out.stdout.splitlines()[-1] == str(expected['investment_score'].tolist())